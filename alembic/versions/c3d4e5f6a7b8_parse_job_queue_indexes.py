@@ -0,0 +1,40 @@
+"""parse job queue indexes
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6g7
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d4e5f6a7b8"
+down_revision: Union[str, None] = "b2c3d4e5f6g7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Worker claim: WHERE status = 'PENDING' AND job_type = ? ORDER BY created_at
+    op.create_index(
+        "ix_recipe_parse_jobs_status_type_created",
+        "recipe_parse_jobs",
+        ["status", "job_type", "created_at"],
+        unique=False,
+    )
+    # abandon_stale_jobs only ever scans COMPLETE rows; partial on Postgres
+    op.create_index(
+        "ix_recipe_parse_jobs_complete_completed_at",
+        "recipe_parse_jobs",
+        ["status", "completed_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'COMPLETE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recipe_parse_jobs_complete_completed_at", table_name="recipe_parse_jobs")
+    op.drop_index("ix_recipe_parse_jobs_status_type_created", table_name="recipe_parse_jobs")
@@ -58,13 +58,13 @@ async def submit_recipe_from_image_job(
         MIN_PIXELS = 256 * 28 * 28  # ~200k
         MAX_PIXELS = 1280 * 28 * 28  # ~1.0M
 
-        img = Image.open(BytesIO(data)).convert("RGB")
+        img = Image.open(BytesIO(data))
         w, h = img.size
         pixels = w * h
         if pixels <= MAX_PIXELS:
             # Already within budget; keep original (no upscaling for small images)
             out = BytesIO()
-            img.save(out, format="JPEG", quality=90)
+            img.convert("RGB").save(out, format="JPEG", quality=90)
             return out.getvalue()
 
         scale = (MAX_PIXELS / pixels) ** 0.5
@@ -76,7 +76,10 @@ async def submit_recipe_from_image_job(
 
         new_w = round28(new_w)
         new_h = round28(new_h)
-        img = img.resize((new_w, new_h), Image.LANCZOS)
+        # Let the JPEG decoder shrink by a power of two first (no-op for other formats),
+        # then resample the rest of the way in reduced steps.
+        img.draft("RGB", (new_w, new_h))
+        img = img.convert("RGB").resize((new_w, new_h), Image.LANCZOS, reducing_gap=3.0)
         out = BytesIO()
         img.save(out, format="JPEG", quality=90)
         return out.getvalue()
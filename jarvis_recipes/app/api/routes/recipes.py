@@ -27,6 +27,19 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/recipes", tags=["recipes"])
 
+STATIC_DATA_PATH = Path(__file__).resolve().parents[4] / "static_data"
+
+# Terminal job states that can no longer be canceled (COMPLETE is handled separately)
+_UNCANCELABLE_STATUSES = frozenset(
+    s.value
+    for s in (
+        parse_job_service.RecipeParseJobStatus.ERROR,
+        parse_job_service.RecipeParseJobStatus.COMMITTED,
+        parse_job_service.RecipeParseJobStatus.ABANDONED,
+        parse_job_service.RecipeParseJobStatus.CANCELED,
+    )
+)
+
 
 class ParseUrlRequest(BaseModel):
     url: AnyHttpUrl
@@ -118,8 +131,7 @@ def get_stock_recipes(
     limit: int = 50,
     current_user: CurrentUser = Depends(get_current_user),
 ):
-    base_path = Path(__file__).resolve().parents[4] / "static_data"
-    return static_recipe_service.list_stock_recipes(base_path, q, limit)
+    return static_recipe_service.list_stock_recipes(STATIC_DATA_PATH, q, limit)
 
 
 @router.get("", response_model=list[RecipeRead])
@@ -373,12 +385,7 @@ def cancel_parse_job(
         )
     
     # For other terminal states, don't allow canceling
-    if job.status in {
-        parse_job_service.RecipeParseJobStatus.ERROR.value,
-        parse_job_service.RecipeParseJobStatus.COMMITTED.value,
-        parse_job_service.RecipeParseJobStatus.ABANDONED.value,
-        parse_job_service.RecipeParseJobStatus.CANCELED.value,
-    }:
+    if job.status in _UNCANCELABLE_STATUSES:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Job cannot be canceled")
     
     ok = parse_job_service.mark_canceled(db, job)
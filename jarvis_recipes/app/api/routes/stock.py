@@ -13,6 +13,8 @@ from jarvis_recipes.app.services import static_seed_service, stock_service, stat
 
 router = APIRouter(tags=["stock"])
 
+STATIC_DATA_PATH = Path(__file__).resolve().parents[4] / "static_data"
+
 
 @router.get("/ingredients/stock", response_model=list[StockIngredientRead])
 def get_stock_ingredients(
@@ -43,8 +45,7 @@ def seed_static_data(
     if not admin_secret or not hmac.compare_digest(admin_secret, settings.admin_secret):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin secret")
 
-    base_path = Path(__file__).resolve().parents[4] / "static_data"
-    stats = static_seed_service.seed_static_data(db, base_path)
+    stats = static_seed_service.seed_static_data(db, STATIC_DATA_PATH)
     return stats
 
 
@@ -57,7 +58,6 @@ def seed_static_recipes(
     settings = get_settings()
     if not admin_secret or not hmac.compare_digest(admin_secret, settings.admin_secret):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin secret")
-    base_path = Path(__file__).resolve().parents[4] / "static_data"
-    stats = static_recipe_service.seed_stock_recipes(db, base_path, user_id)
+    stats = static_recipe_service.seed_stock_recipes(db, STATIC_DATA_PATH, user_id)
     return stats
 
@@ -8,6 +8,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     database_url: str = Field("sqlite:///./jarvis.db", alias="DATABASE_URL")
+    db_pool_size: int = Field(5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_recycle_seconds: int = Field(1800, alias="DB_POOL_RECYCLE_SECONDS")
     auth_secret_key: str = Field("change-me", alias="AUTH_SECRET_KEY")
     auth_algorithm: str = Field("HS256", alias="AUTH_ALGORITHM")
     media_root: Path = Path("media")
@@ -55,6 +58,7 @@ class Settings(BaseSettings):
     redis_host: str = Field("localhost", alias="REDIS_HOST")
     redis_port: int = Field(6379, alias="REDIS_PORT")
     redis_password: str | None = Field(None, alias="REDIS_PASSWORD")
+    redis_pool_size: int = Field(20, alias="REDIS_POOL_SIZE")
 
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, extra="ignore")
 
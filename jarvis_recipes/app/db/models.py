@@ -17,6 +17,7 @@ from sqlalchemy import (
     UniqueConstraint,
     Boolean,
     func,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -188,6 +189,13 @@ class RecipeParseJob(Base):
     __table_args__ = (
         Index("ix_recipe_parse_jobs_user_status", "user_id", "status"),
         Index("ix_recipe_parse_jobs_completed_at", "completed_at"),
+        Index("ix_recipe_parse_jobs_status_type_created", "status", "job_type", "created_at"),
+        Index(
+            "ix_recipe_parse_jobs_complete_completed_at",
+            "status",
+            "completed_at",
+            postgresql_where=text("status = 'COMPLETE'"),
+        ),
     )
 
 
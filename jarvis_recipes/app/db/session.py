@@ -1,12 +1,45 @@
+import os
+
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from jarvis_recipes.app.core.config import get_settings
 
 settings = get_settings()
-connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
+is_sqlite = settings.database_url.startswith("sqlite")
+connect_args = {"check_same_thread": False} if is_sqlite else {}
+pool_args = (
+    {}
+    if is_sqlite
+    else {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+)
+
+
+def _json_serializer(value) -> str:
+    # JSON columns (job_data, result_json, ...) are encoded in native code
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+engine = create_engine(
+    settings.database_url,
+    connect_args=connect_args,
+    future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **pool_args,
+)
+
+# RQ forks a work horse per job; the child must open its own connections rather
+# than reuse sockets inherited from the parent's pool.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: engine.dispose(close=False))
 
-engine = create_engine(settings.database_url, connect_args=connect_args, future=True)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
 
 
@@ -13,7 +13,10 @@ from jarvis_recipes.app.api.deps import verify_app_auth
 from jarvis_recipes.app.api.routes import api_router
 from jarvis_recipes.app.core import service_config
 from jarvis_recipes.app.core.config import enforce_secret_security, get_settings
+from jarvis_recipes.app.services.llm_client import aclose_llm_client
+from jarvis_recipes.app.services.ocr_service_client import aclose_ocr_client
 from jarvis_recipes.app.services.settings_service import get_settings_service
+from jarvis_recipes.app.services.url_parsing.html_fetcher import aclose_fetch_client
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +68,12 @@ def create_app() -> FastAPI:
         else:
             logger.info("Using environment variables for service URLs")
 
+    @app.on_event("shutdown")
+    async def shutdown_event() -> None:
+        await aclose_fetch_client()
+        await aclose_llm_client()
+        await aclose_ocr_client()
+
     return app
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from typing import Dict, List, Optional, Tuple
@@ -10,6 +11,8 @@ from jarvis_recipes.app.services import llm_client, ocr_quality, ocr_service_cli
 
 logger = logging.getLogger(__name__)
 
+OCR_BATCH_TIMEOUT_SECONDS = 300  # Higher timeout for batch (especially with LLM providers)
+
 
 def _detect_content_type(image_bytes: bytes) -> str:
     """Detect image content type from magic bytes."""
@@ -76,15 +79,18 @@ async def run_ingestion_pipeline(
             content_type = _detect_content_type(image_bytes[0])
             
             # Call OCR service batch endpoint for all images
-            # The service handles provider selection (including vision/cloud) automatically
-            combined_text, mean_conf, provider_used, metadata_list = (
-                await ocr_service_client.call_ocr_service_batch(
+            # The service handles provider selection (including vision/cloud) automatically.
+            # httpx timeouts are per-phase, so a slowly trickling response could outlive
+            # them; wait_for caps the whole attempt at its nominal budget.
+            combined_text, mean_conf, provider_used, metadata_list = await asyncio.wait_for(
+                ocr_service_client.call_ocr_service_batch(
                     image_bytes_list=image_bytes,
                     provider="auto",  # Auto selects best provider with validation guardrails
                     content_type=content_type,
                     language_hints=["en"],
-                    timeout_seconds=300,  # Higher timeout for batch (especially with LLM providers)
-                )
+                    timeout_seconds=OCR_BATCH_TIMEOUT_SECONDS,
+                ),
+                timeout=OCR_BATCH_TIMEOUT_SECONDS + 5,
             )
             
             ocr_text = combined_text
@@ -157,6 +163,11 @@ async def run_ingestion_pipeline(
         except OCRServiceUnavailableError:
             # Re-raise to trigger job retry
             raise
+        except asyncio.TimeoutError as ex:
+            duration = int((time.time() - start) * 1000)
+            message = f"OCR batch timed out after {OCR_BATCH_TIMEOUT_SECONDS + 5}s"
+            record_attempt(1, "failed_service_error", duration, {}, message)
+            raise OCRServiceUnavailableError(message) from ex
         except Exception as ex:  # noqa: BLE001
             # OCR service unavailable or failed - mark for retry
             duration = int((time.time() - start) * 1000)
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -16,6 +15,23 @@ from jarvis_recipes.app.services.image_ingest_pipeline import OCRServiceUnavaila
 logger = logging.getLogger(__name__)
 
 
+class _ImageParseResult:
+    """Minimal result shim for parse_job_service.mark_complete.
+
+    mark_complete only calls model_dump(mode="json") and expects a dict with "recipe"
+    or "recipe_draft", so a full ParseResult isn't needed. The payload is already
+    JSON-safe and is returned as is.
+    """
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self._payload = payload
+
+    def model_dump(self, mode: str = "python") -> Dict[str, Any]:
+        return self._payload
+
+
 async def _load_images_from_s3(keys: List[str]) -> List[bytes]:
     loop = asyncio.get_event_loop()
     return [await loop.run_in_executor(None, s3_storage.download_image, key) for key in keys]
@@ -24,7 +40,12 @@ async def _load_images_from_s3(keys: List[str]) -> List[bytes]:
 # Vision processing is now handled by the OCR service via llm_proxy_vision provider
 async def _run_pipeline_and_record(
     db: Session, ingestion: models.RecipeIngestion, image_bytes: List[bytes], tier_max: int, job: models.RecipeParseJob
-) -> Tuple[bool, Optional[RecipeDraft], Dict[str, Any]]:
+) -> Tuple[bool, Optional[RecipeDraft], Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Run OCR + structuring and record the outcome.
+
+    Returns (success, draft, pipeline_json, draft_dict) where draft_dict is the
+    draft's model_dump(), computed once and shared by every consumer.
+    """
     settings = get_settings()
     pipeline_json: Dict[str, Any] = {}
     try:
@@ -43,7 +64,7 @@ async def _run_pipeline_and_record(
         job.error_message = str(exc)
         db.commit()
         db.refresh(job)
-        return False, None, pipeline_json
+        return False, None, pipeline_json, None
     except Exception as exc:  # noqa: BLE001
         logger.exception("Pipeline failed for ingestion %s: %s", ingestion.id, exc)
         ingestion.status = "FAILED"
@@ -61,7 +82,7 @@ async def _run_pipeline_and_record(
                 "message": "Failed to extract recipe from images",
             },
         )
-        return False, None, pipeline_json
+        return False, None, pipeline_json, None
 
     attempts = pipeline_json.get("attempts", []) if isinstance(pipeline_json, dict) else []
 
@@ -77,17 +98,18 @@ async def _run_pipeline_and_record(
         ingestion.pipeline_json = pipeline_json
         db.commit()
         db.refresh(ingestion)
+        draft_dict = draft.model_dump()
         mailbox_service.publish(
             db,
             ingestion.user_id,
             "recipe_image_ingestion_completed",
             {
                 "ingestion_id": ingestion.id,
-                "recipe_draft": draft.model_dump(),
+                "recipe_draft": draft_dict,
                 "pipeline": pipeline_json,
             },
         )
-        return True, draft, pipeline_json
+        return True, draft, pipeline_json, draft_dict
     else:
         ingestion.status = "FAILED"
         ingestion.pipeline_json = pipeline_json
@@ -103,7 +125,7 @@ async def _run_pipeline_and_record(
                 "message": "OCR quality insufficient to extract recipe",
             },
         )
-        return False, None, pipeline_json
+        return False, None, pipeline_json, None
 
 
 async def process_image_ingestion_job(db: Session, job: models.RecipeParseJob) -> None:
@@ -155,12 +177,15 @@ async def process_image_ingestion_job(db: Session, job: models.RecipeParseJob) -
 
     tier_max = payload.get("tier_max") or ingestion.tier_max or 3
     try:
-        success, final_draft, pipeline_json = await _run_pipeline_and_record(db, ingestion, image_bytes, tier_max, job)
+        success, final_draft, pipeline_json, draft_dict = await _run_pipeline_and_record(
+            db, ingestion, image_bytes, tier_max, job
+        )
     except Exception as exc:
         logger.exception("Exception in _run_pipeline_and_record for job %s: %s", job.id, exc)
         pipeline_json = {"error": str(exc), "error_code": "pipeline_exception"}
         success = False
         final_draft = None
+        draft_dict = None
     
     logger.info(
         "image ingestion job finished",
@@ -169,17 +194,7 @@ async def process_image_ingestion_job(db: Session, job: models.RecipeParseJob) -
     
     if success and final_draft:
         try:
-            # Create a result object that mark_complete can process
-            # mark_complete calls result.model_dump_json() and expects JSON with "recipe" or "recipe_draft"
-            class ImageParseResult:
-                def model_dump_json(self):
-                    payload = {
-                        "recipe_draft": final_draft.model_dump(),
-                        "pipeline": pipeline_json,
-                    }
-                    return json.dumps(payload)
-            
-            result = ImageParseResult()
+            result = _ImageParseResult({"recipe_draft": draft_dict, "pipeline": pipeline_json})
             logger.debug("Calling mark_complete for job %s", job.id)
             parse_job_service.mark_complete(db, job, result)
             logger.info("Successfully marked job %s as complete", job.id)
@@ -188,7 +203,7 @@ async def process_image_ingestion_job(db: Session, job: models.RecipeParseJob) -
             # Fall back to marking as error with the pipeline info
             try:
                 db.rollback()
-                job.result_json = {"pipeline": pipeline_json, "recipe_draft": final_draft.model_dump() if final_draft else None}
+                job.result_json = {"pipeline": pipeline_json, "recipe_draft": draft_dict}
                 db.commit()
                 parse_job_service.mark_error(db, job, "mark_complete_failed", str(exc))
             except Exception as exc2:
@@ -1,18 +1,24 @@
-import base64
-import json
 import logging
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import httpx
+import orjson
 from bs4 import BeautifulSoup
 from httpx import HTTPStatusError
 
+# Use the SIMD-accelerated decoder when pybase64 is installed (same API as base64).
+try:  # pragma: no cover
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 from jarvis_recipes.app.schemas.ingestion_input import ImageRef, IngestionInput
 from jarvis_recipes.app.services import url_recipe_parser
 from jarvis_recipes.app.services.url_recipe_parser import (
     ParseResult,
     extract_recipe_from_schema_org,
-    extract_recipe_heuristic,
+    extract_recipe_from_schema_org_soup,
+    extract_recipe_heuristic_soup,
     extract_recipe_from_microdata,
     extract_recipe_via_llm,
     clean_soup_for_content,
@@ -28,21 +34,70 @@ MAX_IMAGES = 8
 MAX_IMAGE_BYTES = 8_000_000
 
 
-def _load_jsonld_blocks(blocks: List[str]) -> str:
+def _exceeds_utf8_bytes(text: str, limit: int) -> bool:
+    """True if ``text`` is more than ``limit`` bytes as UTF-8.
+
+    A UTF-8 character is 1-4 bytes, so the character count settles most inputs
+    without encoding; only the ambiguous band pays for an encode.
+    """
+    if len(text) > limit:
+        return True
+    if len(text) * 4 <= limit:
+        return False
+    return len(text.encode("utf-8")) > limit
+
+
+def _load_jsonld_blocks(blocks: List[str], validated: bool = False) -> str:
     scripts = []
     for b in blocks[:MAX_JSONLD_BLOCKS]:
-        if len(b.encode("utf-8")) > MAX_JSONLD_BYTES:
+        if not validated and _exceeds_utf8_bytes(b, MAX_JSONLD_BYTES):
             continue
         scripts.append(f'<script type="application/ld+json">{b}</script>')
     return "\n".join(scripts)
 
 
+def _is_recipe_node(obj: Any) -> bool:
+    if not isinstance(obj, dict):
+        return False
+    obj_type = obj.get("@type")
+    types = obj_type if isinstance(obj_type, list) else [obj_type]
+    return any(str(t).lower() == "recipe" for t in types if t)
+
+
+def _recipe_blocks(blocks: List[str]) -> List[str]:
+    """Keep only JSON-LD blocks that contain a Recipe node (top level, list item or @graph member).
+
+    Blocks that fail to parse here are kept so the schema.org extractor makes the final call.
+    """
+    kept: List[str] = []
+    for block in blocks:
+        try:
+            data = orjson.loads(block)
+        except orjson.JSONDecodeError:
+            kept.append(block)
+            continue
+        if isinstance(data, list):
+            candidates = data
+        elif isinstance(data, dict):
+            graph = data.get("@graph")
+            candidates = [data, *graph] if isinstance(graph, list) else [data]
+        else:
+            candidates = []
+        if any(_is_recipe_node(c) for c in candidates):
+            kept.append(block)
+    return kept
+
+
 def _decode_images(images: List[ImageRef]) -> List[bytes]:
     if len(images) > MAX_IMAGES:
         raise ValueError("too_many_images")
     out = []
     for img in images:
-        data = base64.b64decode(img.data_base64)
+        # Reject from the encoded length before paying for the decode
+        encoded = img.data_base64
+        if len(encoded) * 3 // 4 - encoded[-2:].count("=") > MAX_IMAGE_BYTES:
+            raise ValueError("image_too_large")
+        data = base64.b64decode(encoded, validate=False)
         if len(data) > MAX_IMAGE_BYTES:
             raise ValueError("image_too_large")
         out.append(data)
@@ -52,6 +107,7 @@ def _decode_images(images: List[ImageRef]) -> List[bytes]:
 async def parse_recipe(input: IngestionInput) -> ParseResult:
     # Strategy order: jsonld -> html -> images -> llm
     html: Optional[str] = None
+    jsonld_too_large = any(_exceeds_utf8_bytes(b, MAX_JSONLD_BYTES) for b in input.jsonld_blocks or [])
     if input.source_type == "server_fetch":
         if not input.source_url:
             return ParseResult(success=False, error_code="invalid_payload", error_message="source_url required", warnings=[])
@@ -102,9 +158,9 @@ async def parse_recipe(input: IngestionInput) -> ParseResult:
         blocks = input.jsonld_blocks or []
         if len(blocks) > MAX_JSONLD_BLOCKS:
             return ParseResult(success=False, error_code="invalid_payload", error_message="too_many_jsonld_blocks", warnings=[])
-        if any(len(b.encode("utf-8")) > MAX_JSONLD_BYTES for b in blocks):
+        if jsonld_too_large:
             return ParseResult(success=False, error_code="invalid_payload", error_message="jsonld_block_too_large", warnings=[])
-        if input.html_snippet and len(input.html_snippet.encode("utf-8")) > MAX_HTML_BYTES:
+        if input.html_snippet and _exceeds_utf8_bytes(input.html_snippet, MAX_HTML_BYTES):
             return ParseResult(success=False, error_code="invalid_payload", error_message="html_snippet_too_large", warnings=[])
         
         # Clean HTML snippet if provided - use existing cleaning functions
@@ -121,19 +177,20 @@ async def parse_recipe(input: IngestionInput) -> ParseResult:
                 else:
                     # Fallback to body if no main node found
                     cleaned_html_snippet = str(soup.body) if soup.body else str(soup)
-                # Limit size to avoid overwhelming LLM (100KB is plenty)
-                if len(cleaned_html_snippet.encode("utf-8")) > 100_000:
-                    cleaned_html_snippet = cleaned_html_snippet[:100_000]
-                logger.info("Cleaned HTML snippet: %d bytes -> %d bytes", 
-                          len(input.html_snippet.encode("utf-8")), 
-                          len(cleaned_html_snippet.encode("utf-8")))
+                # Limit size to avoid overwhelming LLM (100KB is plenty). A string
+                # of at most 100k chars is never trimmed, so no encode is needed.
+                cleaned_html_snippet = cleaned_html_snippet[:100_000]
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Cleaned HTML snippet: %d bytes -> %d bytes", 
+                              len(input.html_snippet.encode("utf-8")), 
+                              len(cleaned_html_snippet.encode("utf-8")))
             except Exception as exc:
                 logger.warning("Failed to clean HTML snippet: %s, using raw", exc)
-                cleaned_html_snippet = input.html_snippet[:100_000] if len(input.html_snippet.encode("utf-8")) > 100_000 else input.html_snippet
+                cleaned_html_snippet = input.html_snippet[:100_000]
         
         html_parts = []
         if blocks:
-            html_parts.append(_load_jsonld_blocks(blocks))
+            html_parts.append(_load_jsonld_blocks(blocks, validated=True))
         if cleaned_html_snippet:
             html_parts.append(cleaned_html_snippet)
         html = "\n".join(html_parts) if html_parts else None
@@ -145,32 +202,19 @@ async def parse_recipe(input: IngestionInput) -> ParseResult:
 
     # JSON-LD first (most reliable)
     if input.jsonld_blocks:
-        logger.info("Attempting JSON-LD extraction with %d blocks", len(input.jsonld_blocks))
+        logger.debug("Attempting JSON-LD extraction with %d blocks", len(input.jsonld_blocks))
         # Log first block to see what we're getting (truncated for safety)
-        if input.jsonld_blocks:
-            first_block = input.jsonld_blocks[0]
-            block_preview = first_block[:500] if len(first_block) > 500 else first_block
-            logger.info("First JSON-LD block preview (first 500 chars): %s", block_preview)
-            # Try to parse and see what @type it has
-            try:
-                data = json.loads(first_block)
-                if isinstance(data, dict):
-                    obj_type = data.get("@type")
-                    logger.info("First JSON-LD block @type: %s", obj_type)
-                elif isinstance(data, list) and len(data) > 0:
-                    first_item = data[0]
-                    if isinstance(first_item, dict):
-                        obj_type = first_item.get("@type")
-                        logger.info("First JSON-LD block is a list, first item @type: %s", obj_type)
-            except json.JSONDecodeError as exc:
-                logger.warning("Could not parse first JSON-LD block to check @type: %s", exc)
-        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First JSON-LD block preview (first 500 chars): %s", input.jsonld_blocks[0][:500])
+
         if len(input.jsonld_blocks) > MAX_JSONLD_BLOCKS:
             return ParseResult(success=False, error_code="invalid_payload", error_message="too_many_jsonld_blocks", warnings=[])
-        if any(len(b.encode("utf-8")) > MAX_JSONLD_BYTES for b in input.jsonld_blocks):
+        if jsonld_too_large:
             return ParseResult(success=False, error_code="invalid_payload", error_message="jsonld_block_too_large", warnings=[])
-        html_for_jsonld = _load_jsonld_blocks(input.jsonld_blocks)
-        parsed = extract_recipe_from_schema_org(html_for_jsonld, input.source_url or "")
+        recipe_blocks = _recipe_blocks(input.jsonld_blocks)
+        logger.debug("%d of %d JSON-LD blocks declare a Recipe @type", len(recipe_blocks), len(input.jsonld_blocks))
+        html_for_jsonld = _load_jsonld_blocks(recipe_blocks, validated=True)
+        parsed = extract_recipe_from_schema_org(html_for_jsonld, input.source_url or "") if recipe_blocks else None
         if parsed:
             logger.info("Successfully extracted recipe from JSON-LD")
             parsed.ingredients = parsed.ingredients or []
@@ -184,12 +228,14 @@ async def parse_recipe(input: IngestionInput) -> ParseResult:
 
     # HTML path (try structured extraction before LLM)
     if html:
-        logger.info("Attempting HTML extraction (schema_org -> microdata -> heuristic)")
-        parsed = extract_recipe_from_schema_org(html, input.source_url or "")
+        logger.debug("Attempting HTML extraction (schema_org -> microdata -> heuristic)")
+        # Parse once and share the tree between the structured extractors
+        soup = BeautifulSoup(html, "lxml")
+        parsed = extract_recipe_from_schema_org_soup(soup, input.source_url or "")
         if not parsed:
             parsed = extract_recipe_from_microdata(html, input.source_url or "")
         if not parsed:
-            parsed = extract_recipe_heuristic(html, input.source_url or "")
+            parsed = extract_recipe_heuristic_soup(soup, input.source_url or "")
         if parsed:
             logger.info("Successfully extracted recipe from HTML using %s", "schema_org" if parsed else "heuristic")
             parsed.ingredients = parsed.ingredients or []
@@ -214,7 +260,7 @@ async def parse_recipe(input: IngestionInput) -> ParseResult:
 
     # LLM fallback if we have html
     if html:
-        logger.info("Attempting LLM extraction (last resort) for %s", input.source_url)
+        logger.debug("Attempting LLM extraction (last resort) for %s", input.source_url)
         try:
             parsed = await extract_recipe_via_llm(html, input.source_url or "")
             parsed.ingredients = parsed.ingredients or []
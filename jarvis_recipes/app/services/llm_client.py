@@ -1,71 +1,89 @@
-import json
+import asyncio
 import logging
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 
-from jarvis_recipes.app.core.config import get_settings
-from jarvis_recipes.app.schemas.ingestion import RecipeDraft
-
-logger = logging.getLogger(__name__)
-
-
-# Remove ASCII control chars that frequently break json.loads (except \n, \r, \t)
-def _strip_invalid_control_chars(s: str) -> str:
-    """Remove ASCII control chars that frequently break json.loads (except \n, \r, \t)."""
-    if not isinstance(s, str):
-        return str(s)
-    # Remove 0x00-0x1F excluding tab(\x09), lf(\x0A), cr(\x0D)
-    return re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F]", "", s)
+# google-re2 (the "re2" extra) matches in linear time; used only for long inputs
+# (see _extract_qty_from_text).
+try:  # pragma: no cover
+    import re2
+except ImportError:
+    re2 = None
 
+from jarvis_recipes.app.core.config import Settings, get_settings
+from jarvis_recipes.app.schemas.ingestion import RecipeDraft, RecipeDraftIngredient, RecipeDraftSource
 
-def _coerce_recipe_draft(obj: Any, source_type: str = "image") -> RecipeDraft:
-    """
-    Accepts various JSON shapes and coerces into RecipeDraft.
-    Expected shape is RecipeDraft; we also accept {"recipe": {...}} with keys:
-      name/title, description, ingredients[{label/name, quantity/unit, notes}], directions/steps[{text}], servings, prepTime/cookTime/totalTime
-    """
-    data = obj
-    def _strip_code_fence(text: str) -> str:
-        txt = text.strip()
-        if txt.startswith("```"):
-            # Remove leading fence with optional language tag
-            txt = re.sub(r"^```[a-zA-Z0-9_-]*\s*", "", txt, count=1)
-            # Remove trailing fence
-            txt = re.sub(r"\s*```$", "", txt, count=1).strip()
-        return txt
-
-    if isinstance(obj, str):
-        cleaned = _strip_code_fence(obj)
-        data = json.loads(cleaned)
-    if isinstance(data, dict) and "recipe" in data:
-        data = data["recipe"]
-    # Check for error field - only raise if it's a meaningful error (not just "{" or empty)
-    if isinstance(data, dict) and data.get("error"):
-        error_val = data.get("error")
-        # Only treat as error if it's a non-empty string or meaningful dict
-        if isinstance(error_val, str) and error_val.strip() and error_val.strip() != "{":
-            raise ValueError(f"LLM returned error: {error_val}")
-        elif isinstance(error_val, dict) and (error_val.get("message") or error_val.get("code")):
-            raise ValueError(f"LLM returned error: {error_val}")
-    # If already valid, let pydantic handle it
-    try:
-        draft = RecipeDraft.model_validate(data)
-        draft.validate_minimums()
-        return draft
-    except Exception as exc:
-        logger.warning("LLM draft validation (direct) failed, attempting coercion: %s", exc)
-
-    if not isinstance(data, dict):
-        raise ValueError("LLM response is not a JSON object")
-
-    title = data.get("title") or data.get("name") or "Untitled"
-    description = data.get("description")
-    ingredients_in = data.get("ingredients") or []
-    steps_in = data.get("steps") or data.get("directions") or []
+logger = logging.getLogger(__name__)
 
-    COMMON_UNITS = {
+FRACTION_CHARS = "¼½¾⅐⅑⅒⅓⅔⅕⅖⅗⅘⅙⅚⅛⅜⅝⅞"
+
+# Deletes 0x00-0x1F excluding tab(\x09), lf(\x0A), cr(\x0D) via str.translate
+_CTRL_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20)])
+_FENCE_TAG_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-")
+QTY_UNIT_PATTERN = rf"^\s*([\d\s\/\.\-{FRACTION_CHARS}]+)\s+([A-Za-z][A-Za-z\.\-]*)\s+(.*)$"
+QTY_ONLY_PATTERN = rf"^\s*([\d\s\/\.\-{FRACTION_CHARS}]+)\s+(.*)$"
+QTY_UNIT_RE = re.compile(QTY_UNIT_PATTERN)
+QTY_ONLY_RE = re.compile(QTY_ONLY_PATTERN)
+# The quantity class overlaps the \s+ that follows it, so the backtracking engine is
+# quadratic in runs of whitespace. RE2 is linear but ~25x slower on typical short
+# ingredient lines, so it only takes over past this length.
+_RE2_MIN_LEN = 256
+_QTY_RE2 = (re2.compile(QTY_UNIT_PATTERN), re2.compile(QTY_ONLY_PATTERN)) if re2 is not None else None
+
+# Bound once; every coerced LLM response goes through it at least once.
+_VALIDATE_DRAFT = RecipeDraft.model_validate
+
+_CLEAN_DRAFT_SYSTEM_PROMPT = (
+    "Clean recipe data. Return ONLY valid JSON matching RecipeDraft schema.\n\n"
+    "Rules:\n"
+    "- Separate ingredients: 'salt and pepper' = 2 entries\n"
+    "- Extract units from names: '1 cup flour' → quantity:'1', unit:'cup', name:'flour'\n"
+    "- Put prep notes in 'notes' field\n"
+    "- Add description if missing (1-2 sentences based on title/ingredients)\n"
+    "- Preserve all valid data, only clean formatting\n"
+)
+
+_TEXT_STRUCTURING_SYSTEM_PROMPT = (
+    "Convert OCR text to RecipeDraft JSON. Return ONLY JSON.\n\n"
+    "Schema: {\"title\":string,\"description\":string|null,\"ingredients\":[{\"name\":string,\"quantity\":string|null,\"unit\":string|null,\"notes\":string|null}],"
+    "\"steps\":[string],\"prep_time_minutes\":int,\"cook_time_minutes\":int,\"total_time_minutes\":int,\"servings\":string|number|null,\"tags\":[string],\"source\":{\"type\":\"ocr\"}}\n\n"
+    "Rules:\n"
+    "- Separate ingredients: 'salt and pepper' = 2 entries\n"
+    "- Extract units from names: '1 cup flour' → quantity:'1', unit:'cup', name:'flour'\n"
+    "- Put prep notes in 'notes' field\n"
+    "- Use 0 for unknown time fields, null for missing description\n"
+    "- If not a valid recipe, return {\"error\":\"garbage_ocr\"}\n"
+)
+
+_MEAL_PLAN_SYSTEM_PROMPT = (
+    "You are a meal planning assistant that selects and ranks recipes from a provided candidate list. "
+    "Your job is to interpret user intent (notes, tags, preferences), encourage variety using recent meal history, "
+    "and return the TOP 3 RANKED recipes that best fit the slot. "
+    "\n\nRULES:\n"
+    "- Return your TOP 3 recipe choices in ranked order (best first).\n"
+    "- You MUST select recipe_ids from the provided candidates list.\n"
+    "- You MUST NOT invent, create, or select recipes not in the candidates list.\n"
+    "- Prefer to suggest options over nothing - even if not perfect matches.\n"
+    "- ONLY return null for the primary selection if candidates are truly incompatible (e.g., user wants vegan but all candidates have meat).\n"
+    "- Variety is a soft constraint: prefer different recipes/proteins across consecutive days when alternatives exist.\n"
+    "- Interpret free-text notes (e.g., 'something easy', 'I want chicken') as ranking signals, not hard requirements.\n"
+    "- Tags and preferences are guidance, not absolute filters - be flexible and helpful.\n"
+    "- Use confidence scores to indicate match quality: 0.9-1.0 = excellent, 0.7-0.9 = good, 0.5-0.7 = acceptable, <0.5 = poor.\n"
+    "- For each ranked option, provide a brief reason explaining why it's a good choice.\n"
+    "- Return ONLY valid JSON matching this schema:\n"
+    '  { "ranked_recipes": [{"recipe_id": "string", "confidence": 0.0-1.0, "reason": "why this fits"}], '
+    '"warnings": ["optional warning strings"] }\n'
+    "- The ranked_recipes array should contain 1-3 recipes in priority order.\n"
+    "- If no candidates fit at all, return ranked_recipes as an empty array with warnings explaining why."
+)
+
+_COMMON_UNITS = frozenset(
+    {
         "tsp",
         "teaspoon",
         "teaspoons",
@@ -108,17 +126,136 @@ def _coerce_recipe_draft(obj: Any, source_type: str = "image") -> RecipeDraft:
         "inch",
         "inches",
     }
+)
+
+# Chat completions are capped at ~1k tokens; anything far larger is a misbehaving proxy.
+_MAX_LLM_RESPONSE_BYTES = 2 * 1024 * 1024
+_LLM_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+# Shared client for LLM proxy calls, bound to the event loop that created it (pooled
+# connections can't cross loops, e.g. workers that asyncio.run() per job).
+_llm_client: Optional[httpx.AsyncClient] = None
+_llm_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+_STEP_KEYS = ("text", "action", "description", "label")
+_QTY_NUMBER_CHARS = frozenset("/" + FRACTION_CHARS)
+_ASCII_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the pooled LLM proxy client; timeouts are passed per request."""
+    global _llm_client, _llm_client_loop
+    loop = asyncio.get_running_loop()
+    if _llm_client is None or _llm_client.is_closed or _llm_client_loop is not loop:
+        _llm_client = httpx.AsyncClient(limits=_LLM_LIMITS)
+        _llm_client_loop = loop
+    return _llm_client
+
+
+async def aclose_llm_client() -> None:
+    """Close the shared LLM proxy client (application shutdown)."""
+    global _llm_client, _llm_client_loop
+    if _llm_client is not None and _llm_client_loop is asyncio.get_running_loop():
+        await _llm_client.aclose()
+    _llm_client = None
+    _llm_client_loop = None
+
+
+async def _stream_chat_completion(
+    settings: Settings, payload: Dict[str, Any], timeout: httpx.Timeout
+) -> Tuple[httpx.Response, Any]:
+    """
+    POST a chat completion and decode the JSON body as it streams in.
+
+    Error responses are returned without reading their body (data is None), and an
+    oversized body is rejected before it is fully buffered.
+    """
+    async with _get_client().stream(
+        "POST",
+        f"{settings.llm_base_url}/v1/chat/completions",
+        content=orjson.dumps(payload),
+        headers=_headers(settings),
+        timeout=timeout,
+    ) as resp:
+        if resp.status_code >= 400:
+            return resp, None
+        buf = bytearray()
+        async for chunk in resp.aiter_bytes():
+            buf.extend(chunk)
+            if len(buf) > _MAX_LLM_RESPONSE_BYTES:
+                raise ValueError(f"LLM response exceeded {_MAX_LLM_RESPONSE_BYTES} bytes")
+    return resp, orjson.loads(buf)
+
+
+# Remove ASCII control chars that frequently break json.loads (except \n, \r, \t)
+def _strip_invalid_control_chars(s: str) -> str:
+    """Remove ASCII control chars that frequently break json.loads (except \n, \r, \t)."""
+    if not isinstance(s, str):
+        return str(s)
+    return s.translate(_CTRL_TABLE)
+
+
+def _strip_code_fence(text: str) -> str:
+    """Strip a leading ```lang fence and a trailing ``` fence without regex."""
+    txt = text.strip()
+    if txt.startswith("```"):
+        # Remove leading fence with optional language tag
+        i = 3
+        while i < len(txt) and txt[i] in _FENCE_TAG_CHARS:
+            i += 1
+        txt = txt[i:].lstrip()
+    if txt.endswith("```"):
+        # Remove trailing fence
+        txt = txt[:-3].rstrip()
+    return txt
+
+
+def _coerce_recipe_draft(obj: Any, source_type: str = "image") -> RecipeDraft:
+    """
+    Accepts various JSON shapes and coerces into RecipeDraft.
+    Expected shape is RecipeDraft; we also accept {"recipe": {...}} with keys:
+      name/title, description, ingredients[{label/name, quantity/unit, notes}], directions/steps[{text}], servings, prepTime/cookTime/totalTime
+    """
+    data = obj
+    if isinstance(obj, str):
+        cleaned = _strip_code_fence(obj)
+        data = orjson.loads(cleaned)
+    if isinstance(data, dict) and "recipe" in data:
+        data = data["recipe"]
+    # Check for error field - only raise if it's a meaningful error (not just "{" or empty)
+    if isinstance(data, dict) and data.get("error"):
+        error_val = data.get("error")
+        # Only treat as error if it's a non-empty string or meaningful dict
+        if isinstance(error_val, str) and error_val.strip() and error_val.strip() != "{":
+            raise ValueError(f"LLM returned error: {error_val}")
+        elif isinstance(error_val, dict) and (error_val.get("message") or error_val.get("code")):
+            raise ValueError(f"LLM returned error: {error_val}")
+    # If already valid, let pydantic handle it
+    try:
+        draft = _VALIDATE_DRAFT(data)
+        draft.validate_minimums()
+        return draft
+    except Exception as exc:
+        logger.warning("LLM draft validation (direct) failed, attempting coercion: %s", exc)
+
+    if not isinstance(data, dict):
+        raise ValueError("LLM response is not a JSON object")
+
+    title = data.get("title") or data.get("name") or "Untitled"
+    description = data.get("description")
+    ingredients_in = data.get("ingredients") or []
+    steps_in = data.get("steps") or data.get("directions") or []
 
     def _extract_qty_from_text(text: str) -> Optional[Tuple[str, Optional[str], str]]:
-        fraction_chars = "¼½¾⅐⅑⅒⅓⅔⅕⅖⅗⅘⅙⅚⅛⅜⅝⅞"
-        qty_unit_re = re.compile(rf"^\s*([\d\s\/\.\-{fraction_chars}]+)\s+([A-Za-z][A-Za-z\.\-]*)\s+(.*)$")
-        qty_only_re = re.compile(rf"^\s*([\d\s\/\.\-{fraction_chars}]+)\s+(.*)$")
+        if _QTY_RE2 is not None and len(text) > _RE2_MIN_LEN:
+            qty_unit_re, qty_only_re = _QTY_RE2
+        else:
+            qty_unit_re, qty_only_re = QTY_UNIT_RE, QTY_ONLY_RE
         m = qty_unit_re.match(text)
         if m:
             qty = m.group(1).strip()
             unit = m.group(2).strip().lower()
             name_rest = m.group(3).strip()
-            if unit in COMMON_UNITS:
+            if unit in _COMMON_UNITS:
                 return qty, unit, name_rest
         m = qty_only_re.match(text)
         if m:
@@ -127,7 +264,9 @@ def _coerce_recipe_draft(obj: Any, source_type: str = "image") -> RecipeDraft:
             return qty, None, name_rest
         return None
 
-    ingredients = []
+    # Normalize ingredients in one pass: flatten quantity shapes, then extract
+    # qty/unit from the quantity field or name if needed
+    normalized_ingredients = []
     for ing in ingredients_in:
         if not isinstance(ing, dict):
             continue
@@ -147,60 +286,21 @@ def _coerce_recipe_draft(obj: Any, source_type: str = "image") -> RecipeDraft:
                 qty = str(qty)
             except (TypeError, ValueError):
                 qty = None
-        name_val = ing.get("name") or ing.get("label") or ""
-        ingredients.append(
-            {
-                "name": name_val,
-                "quantity": qty,
-                "unit": unit,
-                "notes": ing.get("notes"),
-            }
-        )
+        name = ing.get("name") or ing.get("label") or ""
 
-    steps = []
-    for st in steps_in:
-        if isinstance(st, dict):
-            # Handle various step formats: {"text": "..."}, {"action": "..."}, {"description": "..."}, {"label": "..."}
-            step_text = st.get("text") or st.get("action") or st.get("description") or st.get("label") or ""
-            step_text = step_text.strip()
-            if step_text:
-                steps.append(step_text)
-        elif isinstance(st, str):
-            step_text = st.strip()
-            if step_text:
-                steps.append(step_text)
-
-    # Handle time fields with fallbacks
-    prep_time = data.get("prep_time_minutes") or data.get("prepTime")
-    cook_time = data.get("cook_time_minutes") or data.get("cookTime")
-    total_time = data.get("total_time_minutes") or data.get("totalTime")
-    active_time = data.get("activeTime") or data.get("active_time_minutes")
-
-    # If cook_time is missing but active_time or total_time exists, use them conservatively
-    if cook_time is None:
-        cook_time = active_time or total_time or 0
-    if prep_time is None:
-        prep_time = 0
-    if total_time is None and prep_time is not None and cook_time is not None:
-        try:
-            total_time = float(prep_time) + float(cook_time)
-        except (TypeError, ValueError):
-            total_time = 0
-
-    # Normalize ingredients: extract qty/unit from quantity field or name if needed
-    normalized_ingredients = []
-    for ing in ingredients:
-        qty = ing["quantity"]
-        unit = ing["unit"]
-        name = ing["name"] or ""
-        
         # If quantity contains text beyond just a number (e.g., "1 cup mayonnaise" or "2 cups"),
         # extract the number and unit from it
         if qty and isinstance(qty, str):
             # Check if quantity contains both numbers and letters (indicating it has units or ingredient names)
             # We need both to ensure we're not trying to extract from a pure unit like "cup"
-            has_numbers = bool(re.search(r'[\d\/¼½¾⅐⅑⅒⅓⅔⅕⅖⅗⅘⅙⅚⅛⅜⅝⅞]', qty))
-            has_letters = bool(re.search(r'[A-Za-z]', qty))
+            has_numbers = has_letters = False
+            for ch in qty:
+                if not has_numbers and (ch.isdecimal() or ch in _QTY_NUMBER_CHARS):
+                    has_numbers = True
+                elif not has_letters and ch in _ASCII_LETTERS:
+                    has_letters = True
+                if has_numbers and has_letters:
+                    break
             if has_numbers and has_letters:
                 extracted = _extract_qty_from_text(qty)
                 if extracted:
@@ -248,6 +348,36 @@ def _coerce_recipe_draft(obj: Any, source_type: str = "image") -> RecipeDraft:
                 {"name": name.strip(), "quantity": qty, "unit": unit, "notes": notes}
             )
 
+    steps = []
+    for st in steps_in:
+        if isinstance(st, dict):
+            # Handle various step formats: {"text": "..."}, {"action": "..."}, {"description": "..."}, {"label": "..."}
+            step_text = next((st[k] for k in _STEP_KEYS if st.get(k)), "")
+        elif isinstance(st, str):
+            step_text = st
+        else:
+            continue
+        step_text = step_text.strip()
+        if step_text:
+            steps.append(step_text)
+
+    # Handle time fields with fallbacks
+    prep_time = data.get("prep_time_minutes") or data.get("prepTime")
+    cook_time = data.get("cook_time_minutes") or data.get("cookTime")
+    total_time = data.get("total_time_minutes") or data.get("totalTime")
+    active_time = data.get("activeTime") or data.get("active_time_minutes")
+
+    # If cook_time is missing but active_time or total_time exists, use them conservatively
+    if cook_time is None:
+        cook_time = active_time or total_time or 0
+    if prep_time is None:
+        prep_time = 0
+    if total_time is None and prep_time is not None and cook_time is not None:
+        try:
+            total_time = float(prep_time) + float(cook_time)
+        except (TypeError, ValueError):
+            total_time = 0
+
     draft_data = {
         "title": title,
         "description": description,
@@ -260,55 +390,47 @@ def _coerce_recipe_draft(obj: Any, source_type: str = "image") -> RecipeDraft:
         "tags": data.get("tags") or [],
         "source": {"type": source_type},
     }
-    draft = RecipeDraft.model_validate(draft_data)
+    draft = _VALIDATE_DRAFT(draft_data)
     draft.validate_minimums()
     return draft
 
 
 def _fallback_draft(reason: str, source_type: str = "image") -> RecipeDraft:
     # Provide a minimal, user-editable draft to avoid failing the ingestion entirely.
+    # Every field is a constant we control, so skip validation (RecipeDraft has no validators).
     placeholders = [
-        {"name": "Add ingredient", "quantity": None, "unit": None, "notes": reason},
-        {"name": "Add ingredient", "quantity": None, "unit": None, "notes": reason},
-        {"name": "Add ingredient", "quantity": None, "unit": None, "notes": reason},
+        RecipeDraftIngredient.model_construct(name="Add ingredient", quantity=None, unit=None, notes=reason)
+        for _ in range(3)
     ]
     steps = ["Add steps manually", "Add steps manually"]
-    draft_data = {
-        "title": "Untitled",
-        "description": None,
-        "ingredients": placeholders,
-        "steps": steps,
-        "prep_time_minutes": 0,
-        "cook_time_minutes": 0,
-        "total_time_minutes": 0,
-        "servings": None,
-        "tags": [],
-        "source": {"type": source_type},
-    }
-    draft = RecipeDraft.model_validate(draft_data)
-    return draft
+    return RecipeDraft.model_construct(
+        title="Untitled",
+        description=None,
+        ingredients=placeholders,
+        steps=steps,
+        prep_time_minutes=0,
+        cook_time_minutes=0,
+        total_time_minutes=0,
+        servings=None,
+        tags=[],
+        source=RecipeDraftSource.model_construct(type=source_type),
+    )
 
 
 def _try_local_json_repair(raw: str) -> Optional[str]:
-    cleaned = _strip_invalid_control_chars(raw).strip()
-    cleaned = re.sub(r"^```[a-zA-Z0-9_-]*\s*", "", cleaned)
-    cleaned = re.sub(r"\s*```$", "", cleaned)
-    if cleaned.startswith("{") and cleaned.endswith("}"):
-        try:
-            json.loads(cleaned)
-            return cleaned
-        except json.JSONDecodeError:
-            pass
+    cleaned = _strip_code_fence(_strip_invalid_control_chars(raw))
+    # Outermost braces; when cleaned is already "{...}" the slice is the whole string,
+    # so a failed parse is not retried on identical input.
     start = cleaned.find("{")
     end = cleaned.rfind("}")
-    if start != -1 and end != -1 and end > start:
-        snippet = cleaned[start : end + 1]
-        try:
-            json.loads(snippet)
-            return snippet
-        except json.JSONDecodeError:
-            return None
-    return None
+    if start == -1 or end <= start:
+        return None
+    snippet = cleaned[start : end + 1]
+    try:
+        orjson.loads(snippet)
+        return snippet
+    except orjson.JSONDecodeError:
+        return None
 
 
 async def _repair_json_via_full_llm(broken_json: str, schema_hint: str, timeout_seconds: int = 60) -> Optional[str]:
@@ -331,15 +453,15 @@ async def _repair_json_via_full_llm(broken_json: str, schema_hint: str, timeout_
         "stream": False,
     }
     timeout = httpx.Timeout(timeout_seconds, read=timeout_seconds, connect=10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        resp = await client.post(
-            f"{settings.llm_base_url}/v1/chat/completions",
-            json=payload,
-            headers=_headers(),
-        )
+    resp = await _get_client().post(
+        f"{settings.llm_base_url}/v1/chat/completions",
+        content=orjson.dumps(payload),
+        headers=_headers(settings),
+        timeout=timeout,
+    )
     if resp.status_code >= 400:
         return None
-    data = resp.json()
+    data = orjson.loads(resp.content)
     
     # Check for error response from LLM proxy (per PRD: json-response-format-support.md)
     if isinstance(data, dict) and "error" in data:
@@ -356,37 +478,41 @@ async def _repair_json_via_full_llm(broken_json: str, schema_hint: str, timeout_
     content = data.get("choices", [{}])[0].get("message", {}).get("content")
     if not content:
         return None
-    repaired = content.strip()
-    repaired = re.sub(r"^```[a-zA-Z0-9_-]*\s*", "", repaired)
-    repaired = re.sub(r"\s*```$", "", repaired)
+    repaired = _strip_code_fence(content)
     try:
-        json.loads(repaired)
+        orjson.loads(repaired)
         return repaired
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return None
 
 
-def _headers() -> Dict[str, str]:
-    settings = get_settings()
-    if not settings.jarvis_app_id or not settings.jarvis_app_key:
-        raise ValueError("JARVIS_APP_ID and JARVIS_APP_KEY must be set for LLM proxy authentication")
+@lru_cache(maxsize=4)
+def _auth_headers(app_id: str, app_key: str) -> Dict[str, str]:
+    # Shared across requests; httpx merges it into its own Headers and never mutates it.
     return {
         "Content-Type": "application/json",
-        "X-Jarvis-App-Id": settings.jarvis_app_id,
-        "X-Jarvis-App-Key": settings.jarvis_app_key,
+        "X-Jarvis-App-Id": app_id,
+        "X-Jarvis-App-Key": app_key,
     }
 
 
+def _headers(settings: Optional[Settings] = None) -> Dict[str, str]:
+    settings = settings or get_settings()
+    if not settings.jarvis_app_id or not settings.jarvis_app_key:
+        raise ValueError("JARVIS_APP_ID and JARVIS_APP_KEY must be set for LLM proxy authentication")
+    return _auth_headers(settings.jarvis_app_id, settings.jarvis_app_key)
+
+
 async def _parse_with_repair(raw_content: str, source_type: str) -> RecipeDraft:
     raw_content = _strip_invalid_control_chars(raw_content)
     try:
         return _coerce_recipe_draft(raw_content, source_type=source_type)
-    except (json.JSONDecodeError, ValueError, KeyError, TypeError):
+    except (orjson.JSONDecodeError, ValueError, KeyError, TypeError):
         repaired = _try_local_json_repair(raw_content)
         if repaired:
             try:
                 return _coerce_recipe_draft(repaired, source_type=source_type)
-            except (json.JSONDecodeError, ValueError, KeyError, TypeError):
+            except (orjson.JSONDecodeError, ValueError, KeyError, TypeError):
                 pass
         schema_hint = (
             '{ "title": string, "description": string|null, "ingredients": '
@@ -420,8 +546,8 @@ async def clean_and_validate_draft(draft: RecipeDraft, model_name: str) -> Recip
     """
     settings = get_settings()
     
-    # Convert draft to JSON for the LLM
-    draft_json = draft.model_dump(mode="json")
+    # Convert draft to JSON for the LLM (pydantic-core writes the text directly, no intermediate dict)
+    draft_json = draft.model_dump_json(indent=2)
     
     payload = {
         "model": model_name or settings.llm_lightweight_model_name or "live",
@@ -430,19 +556,11 @@ async def clean_and_validate_draft(draft: RecipeDraft, model_name: str) -> Recip
         "messages": [
             {
                 "role": "system",
-                "content": (
-                    "Clean recipe data. Return ONLY valid JSON matching RecipeDraft schema.\n\n"
-                    "Rules:\n"
-                    "- Separate ingredients: 'salt and pepper' = 2 entries\n"
-                    "- Extract units from names: '1 cup flour' → quantity:'1', unit:'cup', name:'flour'\n"
-                    "- Put prep notes in 'notes' field\n"
-                    "- Add description if missing (1-2 sentences based on title/ingredients)\n"
-                    "- Preserve all valid data, only clean formatting\n"
-                ),
+                "content": _CLEAN_DRAFT_SYSTEM_PROMPT,
             },
             {
                 "role": "user",
-                "content": f"Clean this recipe:\n{json.dumps(draft_json, indent=2)}",
+                "content": f"Clean this recipe:\n{draft_json}",
             },
         ],
         "max_tokens": 1000,
@@ -451,14 +569,14 @@ async def clean_and_validate_draft(draft: RecipeDraft, model_name: str) -> Recip
     
     timeout = httpx.Timeout(30.0, read=30.0, connect=10.0)
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.post(
-                f"{settings.llm_base_url}/v1/chat/completions",
-                json=payload,
-                headers=_headers(),
-            )
+        resp = await _get_client().post(
+            f"{settings.llm_base_url}/v1/chat/completions",
+            content=orjson.dumps(payload),
+            headers=_headers(settings),
+            timeout=timeout,
+        )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
         
         # Check for error response
         if isinstance(data, dict) and "error" in data:
@@ -479,12 +597,10 @@ async def clean_and_validate_draft(draft: RecipeDraft, model_name: str) -> Recip
             return draft
         
         # Parse the cleaned draft
-        cleaned_content = content.strip()
-        cleaned_content = re.sub(r"^```[a-zA-Z0-9_-]*\s*", "", cleaned_content)
-        cleaned_content = re.sub(r"\s*```$", "", cleaned_content)
+        cleaned_content = _strip_code_fence(content)
         
         try:
-            cleaned_data = json.loads(cleaned_content)
+            cleaned_data = orjson.loads(cleaned_content)
             cleaned_draft = _coerce_recipe_draft(cleaned_data, source_type=draft.source.type if draft.source else "ocr")
             logger.info("Draft cleaned successfully: %d ingredients, %d steps", 
                        len(cleaned_draft.ingredients), len(cleaned_draft.steps))
@@ -507,17 +623,7 @@ async def call_text_structuring(text: str, model_name: str) -> RecipeDraft:
         "messages": [
             {
                 "role": "system",
-                "content": (
-                    "Convert OCR text to RecipeDraft JSON. Return ONLY JSON.\n\n"
-                    "Schema: {\"title\":string,\"description\":string|null,\"ingredients\":[{\"name\":string,\"quantity\":string|null,\"unit\":string|null,\"notes\":string|null}],"
-                    "\"steps\":[string],\"prep_time_minutes\":int,\"cook_time_minutes\":int,\"total_time_minutes\":int,\"servings\":string|number|null,\"tags\":[string],\"source\":{\"type\":\"ocr\"}}\n\n"
-                    "Rules:\n"
-                    "- Separate ingredients: 'salt and pepper' = 2 entries\n"
-                    "- Extract units from names: '1 cup flour' → quantity:'1', unit:'cup', name:'flour'\n"
-                    "- Put prep notes in 'notes' field\n"
-                    "- Use 0 for unknown time fields, null for missing description\n"
-                    "- If not a valid recipe, return {\"error\":\"garbage_ocr\"}\n"
-                ),
+                "content": _TEXT_STRUCTURING_SYSTEM_PROMPT,
             },
             {
                 "role": "user",
@@ -528,14 +634,8 @@ async def call_text_structuring(text: str, model_name: str) -> RecipeDraft:
         "stream": False,
     }
     timeout = httpx.Timeout(60.0, read=60.0, connect=10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        resp = await client.post(
-            f"{settings.llm_base_url}/v1/chat/completions",
-            json=payload,
-            headers=_headers(),
-        )
+    resp, data = await _stream_chat_completion(settings, payload, timeout)
     resp.raise_for_status()
-    data = resp.json()
     
     # Check for error response from LLM proxy (per PRD: json-response-format-support.md)
     if isinstance(data, dict) and "error" in data:
@@ -567,9 +667,13 @@ async def call_meal_plan_select(
     candidates: List[Dict[str, Any]],
     model_name: Optional[str] = None,
     timeout_seconds: int = 30,
+    candidate_index: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     """
     Invoke LLM to select the best recipe from candidates for a meal slot.
+
+    candidate_index maps candidate id -> candidate; callers that already built one
+    for their own lookups can pass it to skip rebuilding it here.
     
     Returns:
         {
@@ -586,12 +690,12 @@ async def call_meal_plan_select(
         {
             "recipe_id": c.get("id"),
             "title": c.get("title"),
-            "tags": c.get("tags", []),
+            "tags": c.get("tags") or (),
             "prep_time": c.get("prep_time_minutes"),
             "cook_time": c.get("cook_time_minutes"),
-            "summary": c.get("description", "")[:100] if c.get("description") else None,
+            "summary": d[:100] if (d := c.get("description")) else None,
         }
-        for c in candidates[:25]
+        for c in islice(candidates, 25)
     ]
     
     prompt_input = {
@@ -601,30 +705,9 @@ async def call_meal_plan_select(
         "candidates": candidate_summaries,
     }
     
-    system_prompt = (
-        "You are a meal planning assistant that selects and ranks recipes from a provided candidate list. "
-        "Your job is to interpret user intent (notes, tags, preferences), encourage variety using recent meal history, "
-        "and return the TOP 3 RANKED recipes that best fit the slot. "
-        "\n\nRULES:\n"
-        "- Return your TOP 3 recipe choices in ranked order (best first).\n"
-        "- You MUST select recipe_ids from the provided candidates list.\n"
-        "- You MUST NOT invent, create, or select recipes not in the candidates list.\n"
-        "- Prefer to suggest options over nothing - even if not perfect matches.\n"
-        "- ONLY return null for the primary selection if candidates are truly incompatible (e.g., user wants vegan but all candidates have meat).\n"
-        "- Variety is a soft constraint: prefer different recipes/proteins across consecutive days when alternatives exist.\n"
-        "- Interpret free-text notes (e.g., 'something easy', 'I want chicken') as ranking signals, not hard requirements.\n"
-        "- Tags and preferences are guidance, not absolute filters - be flexible and helpful.\n"
-        "- Use confidence scores to indicate match quality: 0.9-1.0 = excellent, 0.7-0.9 = good, 0.5-0.7 = acceptable, <0.5 = poor.\n"
-        "- For each ranked option, provide a brief reason explaining why it's a good choice.\n"
-        "- Return ONLY valid JSON matching this schema:\n"
-        '  { "ranked_recipes": [{"recipe_id": "string", "confidence": 0.0-1.0, "reason": "why this fits"}], '
-        '"warnings": ["optional warning strings"] }\n'
-        "- The ranked_recipes array should contain 1-3 recipes in priority order.\n"
-        "- If no candidates fit at all, return ranked_recipes as an empty array with warnings explaining why."
-    )
-    
+    prompt_json = orjson.dumps(prompt_input, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
     user_prompt = (
-        f"Select the best recipe for this meal slot:\n{json.dumps(prompt_input, indent=2)}\n\n"
+        f"Select the best recipe for this meal slot:\n{prompt_json}\n\n"
         "Return your selection as JSON only. No prose, no markdown."
     )
     
@@ -633,7 +716,7 @@ async def call_meal_plan_select(
         "temperature": 0.2,
         "response_format": {"type": "json_object"},
         "messages": [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _MEAL_PLAN_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt},
         ],
         "max_tokens": 300,
@@ -643,12 +726,7 @@ async def call_meal_plan_select(
     timeout = httpx.Timeout(timeout_seconds, read=timeout_seconds, connect=10.0)
     
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.post(
-                f"{settings.llm_base_url}/v1/chat/completions",
-                json=payload,
-                headers=_headers(),
-            )
+        resp, data = await _stream_chat_completion(settings, payload, timeout)
         
         if resp.status_code >= 400:
             logger.warning("Meal plan LLM selection failed with status %s", resp.status_code)
@@ -659,8 +737,6 @@ async def call_meal_plan_select(
                 "warnings": ["LLM unavailable"],
             }
         
-        data = resp.json()
-        
         # Check for error response from LLM proxy (per PRD: json-response-format-support.md)
         if isinstance(data, dict) and "error" in data:
             error_info = data["error"]
@@ -691,19 +767,20 @@ async def call_meal_plan_select(
             }
         
         # Parse and validate
-        result = json.loads(content)
+        result = orjson.loads(_strip_code_fence(content))
         
         # Extract ranked recipes and warnings
         ranked_recipes = result.get("ranked_recipes", [])
         warnings = result.get("warnings", [])
         
         # Validate all recipe IDs are in candidates
-        candidate_ids = {c.get("id") for c in candidates}
+        if candidate_index is None:
+            candidate_index = {c.get("id"): c for c in candidates}
         validated_ranked = []
         
         for idx, ranked in enumerate(ranked_recipes[:3]):  # Max 3
             recipe_id = ranked.get("recipe_id")
-            if recipe_id and recipe_id in candidate_ids:
+            if recipe_id and recipe_id in candidate_index:
                 confidence = ranked.get("confidence", 0.5)
                 if not isinstance(confidence, (int, float)) or confidence < 0 or confidence > 1:
                     confidence = 0.5
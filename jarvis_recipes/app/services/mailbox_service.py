@@ -6,7 +6,10 @@ from sqlalchemy.orm import Session
 from jarvis_recipes.app.db import models
 
 
-def publish(db: Session, user_id: str, msg_type: str, payload: Dict[str, Any]) -> models.MailboxMessage:
+def publish(
+    db: Session, user_id: str, msg_type: str, payload: Dict[str, Any], *, commit: bool = True
+) -> models.MailboxMessage:
+    """Queue a mailbox message; with commit=False it rides on the caller's next commit."""
     message = models.MailboxMessage(
         id=str(uuid.uuid4()),
         user_id=str(user_id),
@@ -14,6 +17,8 @@ def publish(db: Session, user_id: str, msg_type: str, payload: Dict[str, Any]) -
         payload=payload,
     )
     db.add(message)
+    if not commit:
+        return message
     db.commit()
     db.refresh(message)
     return message
@@ -1,11 +1,14 @@
 import asyncio
 import logging
 import uuid
+from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, selectinload
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,9 @@ from jarvis_recipes.app.schemas.meal_plan import (
 from jarvis_recipes.app.services import llm_client, mailbox_service, static_recipe_service
 
 MEAL_ORDER: List[MealType] = ["breakfast", "lunch", "dinner", "snack", "dessert"]
+STATIC_DATA_PATH = Path(__file__).resolve().parents[3] / "static_data"
+LLM_SELECT_CONCURRENCY = 8
+CLEANUP_BATCH_SIZE = 1000
 
 
 def search_recipes(
@@ -34,27 +40,43 @@ def search_recipes(
     exclude_terms: List[str],
     max_prep_minutes: Optional[int],
     max_cook_minutes: Optional[int],
-    exclude_recipe_ids: List[str],
+    exclude_recipe_ids: AbstractSet[str],
     limit: int = 25,
 ) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    # User recipes
-    q = db.query(models.Recipe).filter(models.Recipe.user_id == user_id)
+    # User recipes (only the columns we return, tags fetched in one follow-up query)
+    stmt = select(
+        models.Recipe.id,
+        models.Recipe.title,
+        models.Recipe.description,
+        models.Recipe.total_time_minutes,
+    ).where(models.Recipe.user_id == user_id)
+    # User recipe ids are integers; stage/core ids in the exclusion list can't match them
+    excluded_user_ids = [int(i) for i in exclude_recipe_ids if i.isdigit()]
+    if excluded_user_ids:
+        stmt = stmt.where(models.Recipe.id.notin_(excluded_user_ids))
+    if tags_any:
+        stmt = stmt.where(models.Recipe.tags.any(models.Tag.name.in_(tags_any)))
     if include_terms:
         for term in include_terms[:5]:
             like = f"%{term}%"
-            q = q.filter((models.Recipe.title.ilike(like)) | (models.Recipe.description.ilike(like)))
+            stmt = stmt.where((models.Recipe.title.ilike(like)) | (models.Recipe.description.ilike(like)))
     if exclude_terms:
         for term in exclude_terms[:5]:
             like = f"%{term}%"
-            q = q.filter(~models.Recipe.title.ilike(like))
-    user_recipes = q.limit(limit).all()
+            stmt = stmt.where(~models.Recipe.title.ilike(like))
+    user_recipes = db.execute(stmt.limit(limit)).all()
+    tags_by_recipe: Dict[int, List[str]] = defaultdict(list)
+    if user_recipes:
+        tag_rows = db.execute(
+            select(models.recipe_tags.c.recipe_id, models.Tag.name)
+            .join(models.Tag, models.Tag.id == models.recipe_tags.c.tag_id)
+            .where(models.recipe_tags.c.recipe_id.in_([r.id for r in user_recipes]))
+        )
+        for recipe_id, tag_name in tag_rows:
+            tags_by_recipe[recipe_id].append(tag_name)
     for r in user_recipes:
-        if str(r.id) in exclude_recipe_ids:
-            continue
-        tag_names = [t.name for t in r.tags] if hasattr(r, "tags") else []
-        if tags_any and not set(tags_any).intersection(tag_names):
-            continue
+        tag_names = tags_by_recipe.get(r.id, [])
         results.append(
             {
                 "id": str(r.id),
@@ -68,32 +90,41 @@ def search_recipes(
         )
 
     # Core (stock) recipes - always include
-        base_path = Path(__file__).resolve().parents[3] / "static_data"
-        stock = static_recipe_service.list_stock_recipes(base_path, None, limit=limit)
-        for s in stock:
-            if s.get("id") in exclude_recipe_ids:
-                continue
-            tags = s.get("tags") or []
-            if tags_any and not set(tags_any).intersection(tags):
-                continue
-            results.append(
-                {
-                    "id": s.get("id"),
-                    "source": "core",
-                    "title": s.get("title"),
-                    "description": s.get("description"),
-                    "tags": tags,
-                    "prep_time_minutes": s.get("prep_time_minutes") or 0,
-                    "cook_time_minutes": s.get("cook_time_minutes") or 0,
-                }
-            )
+    stock = static_recipe_service.list_stock_recipes(STATIC_DATA_PATH, None, limit=limit)
+    if tags_any:
+        # Tag filter via the inverted index: union of positions, kept within the stock page
+        _, tag_positions = static_recipe_service.stock_recipe_index(STATIC_DATA_PATH)
+        positions = set().union(*(tag_positions.get(t, ()) for t in tags_any))
+        stock = [stock[pos] for pos in sorted(positions) if pos < len(stock)]
+    for s in stock:
+        if s.get("id") in exclude_recipe_ids:
+            continue
+        results.append(
+            {
+                "id": s.get("id"),
+                "source": "core",
+                "title": s.get("title"),
+                "description": s.get("description"),
+                "tags": s.get("tags") or [],
+                "prep_time_minutes": s.get("prep_time_minutes") or 0,
+                "cook_time_minutes": s.get("cook_time_minutes") or 0,
+            }
+        )
 
     return results[:limit]
 
 
 def get_recipe_details(db: Session, user_id: str, source: str, recipe_id: str) -> Optional[Dict[str, Any]]:
     if source == "user":
-        recipe = db.get(models.Recipe, int(recipe_id))
+        recipe = db.get(
+            models.Recipe,
+            int(recipe_id),
+            options=[
+                selectinload(models.Recipe.ingredients),
+                selectinload(models.Recipe.steps),
+                selectinload(models.Recipe.tags),
+            ],
+        )
         if not recipe or recipe.user_id != user_id:
             return None
         return {
@@ -125,44 +156,55 @@ def get_recipe_details(db: Session, user_id: str, source: str, recipe_id: str) -
             "notes": stage.notes or [],
         }
     if source == "core":
-        base_path = Path(__file__).resolve().parents[3] / "static_data"
-        stock = static_recipe_service.list_stock_recipes(base_path, None, limit=500)
-        for s in stock:
-            if s.get("id") == recipe_id:
-                return {
-                    "id": s.get("id"),
-                    "title": s.get("title"),
-                    "description": s.get("description"),
-                    "yield": None,
-                    "prep_time_minutes": s.get("prep_time_minutes") or 0,
-                    "cook_time_minutes": s.get("cook_time_minutes") or 0,
-                    "ingredients": [{"text": t, "section": None} for t in s.get("ingredients") or []],
-                    "steps": [{"text": t, "section": None} for t in s.get("steps") or []],
-                    "tags": s.get("tags") or [],
-                    "notes": [],
-                }
+        return _core_recipe_details(recipe_id)
     return None
 
 
+@lru_cache(maxsize=512)
+def _core_recipe_details(recipe_id: str) -> Optional[Dict[str, Any]]:
+    # Stock data is static per process, so each core recipe is shaped once and shared
+    # (callers only read it when staging).
+    by_id, _ = static_recipe_service.stock_recipe_index(STATIC_DATA_PATH)
+    s = by_id.get(recipe_id)
+    if not s:
+        return None
+    return {
+        "id": s.get("id"),
+        "title": s.get("title"),
+        "description": s.get("description"),
+        "yield": None,
+        "prep_time_minutes": s.get("prep_time_minutes") or 0,
+        "cook_time_minutes": s.get("cook_time_minutes") or 0,
+        "ingredients": [{"text": t, "section": None} for t in s.get("ingredients") or []],
+        "steps": [{"text": t, "section": None} for t in s.get("steps") or []],
+        "tags": s.get("tags") or [],
+        "notes": [],
+    }
+
+
+def build_stage_row(user_id: str, source_recipe: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    """Column values for a new StageRecipe, with its id pre-generated."""
+    now = datetime.utcnow()
+    return {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "title": source_recipe.get("title") or "Untitled",
+        "description": source_recipe.get("description"),
+        "yield_text": source_recipe.get("yield"),
+        "prep_time_minutes": source_recipe.get("prep_time_minutes") or 0,
+        "cook_time_minutes": source_recipe.get("cook_time_minutes") or 0,
+        "ingredients": source_recipe.get("ingredients") or [],
+        "steps": source_recipe.get("steps") or [],
+        "tags": source_recipe.get("tags") or [],
+        "notes": source_recipe.get("notes") or [],
+        "request_id": request_id,
+        "created_at": now,
+        "expires_at": now + timedelta(hours=72),
+    }
+
+
 def create_stage_recipe(db: Session, user_id: str, source_recipe: Dict[str, Any], request_id: str) -> str:
-    expires_at = datetime.utcnow() + timedelta(hours=72)
-    stage_id = str(uuid.uuid4())
-    stage = models.StageRecipe(
-        id=stage_id,
-        user_id=user_id,
-        title=source_recipe.get("title") or "Untitled",
-        description=source_recipe.get("description"),
-        yield_text=source_recipe.get("yield"),
-        prep_time_minutes=source_recipe.get("prep_time_minutes") or 0,
-        cook_time_minutes=source_recipe.get("cook_time_minutes") or 0,
-        ingredients=source_recipe.get("ingredients") or [],
-        steps=source_recipe.get("steps") or [],
-        tags=source_recipe.get("tags") or [],
-        notes=source_recipe.get("notes") or [],
-        request_id=request_id,
-        created_at=datetime.utcnow(),
-        expires_at=expires_at,
-    )
+    stage = models.StageRecipe(**build_stage_row(user_id, source_recipe, request_id))
     db.add(stage)
     db.commit()
     db.refresh(stage)
@@ -209,6 +251,46 @@ def get_recent_meals(
     return []
 
 
+async def _select_day_slots(
+    day: Any,
+    day_slots: List[Tuple[str, Any, List[Dict[str, Any]], Dict[Any, Dict[str, Any]]]],
+    req: MealPlanGenerateRequest,
+    recent_meals: List[Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """Run the LLM selection for every slot of a day concurrently, keyed by meal type."""
+    semaphore = asyncio.Semaphore(LLM_SELECT_CONCURRENCY)
+    preferences_data = {
+        "diet": None,
+        "excluded_ingredients": req.preferences.hard.excluded_ingredients,
+        "max_prep_minutes": req.preferences.soft.max_prep_minutes,
+        "max_cook_minutes": req.preferences.soft.max_cook_minutes,
+    }
+
+    async def _select(
+        meal_key: str, slot: Any, candidates: List[Dict[str, Any]], candidate_index: Dict[Any, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        slot_data = {
+            "date": str(day.date),
+            "meal_type": meal_key,
+            "servings": slot.servings,
+            "tags": slot.tags or [],
+            "notes": slot.note,
+            "is_meal_prep": slot.is_meal_prep,
+        }
+        async with semaphore:
+            return await llm_client.call_meal_plan_select(
+                slot=slot_data,
+                preferences=preferences_data,
+                recent_meals=recent_meals,
+                candidates=candidates,
+                candidate_index=candidate_index,
+            )
+
+    pending = [entry for entry in day_slots if entry[2]]
+    results = await asyncio.gather(*(_select(*entry) for entry in pending))
+    return {entry[0]: result for entry, result in zip(pending, results)}
+
+
 def generate_meal_plan(
     db: Session,
     user_id: str,
@@ -217,7 +299,7 @@ def generate_meal_plan(
     progress_every: int = 3,
     search_fn=search_recipes,
     details_fn=get_recipe_details,
-    stage_fn=create_stage_recipe,
+    stage_fn=None,
     use_llm: bool = True,
 ) -> Tuple[MealPlanResult, int]:
     """
@@ -225,7 +307,27 @@ def generate_meal_plan(
     
     If use_llm=True (default), the LLM will select the best recipe from candidates per slot.
     If use_llm=False, the first candidate will be selected deterministically (for testing/fallback).
+    Without a stage_fn, staged core recipes are collected and inserted in one batch at the end.
     """
+    pending_stage_rows: List[Dict[str, Any]] = []
+
+    def _queue_stage(db: Session, user_id: str, source_recipe: Dict[str, Any], request_id: str) -> str:
+        row = build_stage_row(user_id, source_recipe, request_id)
+        pending_stage_rows.append(row)
+        return row["id"]
+
+    if stage_fn is None:
+        stage_fn = _queue_stage
+
+    # The same recipe often comes back for several slots (as a pick or an alternative)
+    details_cache: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+
+    def _details(source: str, recipe_id: str) -> Optional[Dict[str, Any]]:
+        key = (source, recipe_id)
+        if key not in details_cache:
+            details_cache[key] = details_fn(db=db, user_id=user_id, source=source, recipe_id=recipe_id)
+        return details_cache[key]
+
     days_sorted = sorted(req.days, key=lambda d: d.date)
     day_results: List[DayResult] = []
     slot_counter = 0
@@ -236,161 +338,192 @@ def generate_meal_plan(
     # Fetch recent meals for variety control
     recent_meals = get_recent_meals(db, user_id, lookback_days=7)
     
-    for day in days_sorted:
-        meal_results: Dict[str, MealSlotResult] = {}
-        for meal_key in MEAL_ORDER:
-            slot = day.meals.get(meal_key)
-            if not slot:
-                continue
-            slot_counter += 1
-            terms = _build_terms(slot)
-            candidates = search_fn(
-                db=db,
-                user_id=user_id,
-                meal_type=meal_key,  # type: ignore[arg-type]
-                tags_any=slot.tags or req.preferences.soft.tags,
-                tags_all=[],
-                include_terms=terms["include_terms"],
-                exclude_terms=req.preferences.hard.excluded_ingredients + terms["exclude_terms"],
-                max_prep_minutes=req.preferences.soft.max_prep_minutes,
-                max_cook_minutes=req.preferences.soft.max_cook_minutes,
-                exclude_recipe_ids=list(used_recipe_ids),
-                limit=25,
-            )
-            
-            # Debug logging
-            logger.info(
-                f"Slot {slot_counter} ({day.date} {meal_key}): "
-                f"tags={slot.tags}, found {len(candidates)} candidates, "
-                f"excluded={len(used_recipe_ids)} recipes"
-            )
-            selection = None
-            selection_warnings: List[str] = []
-            cand = None
-            confidence = None
-            
-            if candidates:
-                # Use LLM to select the best candidate
-                if use_llm:
-                    slot_data = {
-                        "date": str(day.date),
-                        "meal_type": meal_key,
-                        "servings": slot.servings,
-                        "tags": slot.tags or [],
-                        "notes": slot.note,
-                        "is_meal_prep": slot.is_meal_prep,
-                    }
-                    preferences_data = {
-                        "diet": None,
-                        "excluded_ingredients": req.preferences.hard.excluded_ingredients,
-                        "max_prep_minutes": req.preferences.soft.max_prep_minutes,
-                        "max_cook_minutes": req.preferences.soft.max_cook_minutes,
-                    }
-                    
-                    # Call LLM selection (sync wrapper for async call)
-                    llm_result = asyncio.run(
-                        llm_client.call_meal_plan_select(
-                            slot=slot_data,
-                            preferences=preferences_data,
-                            recent_meals=recent_meals,
-                            candidates=candidates,
-                        )
-                    )
-                    
-                    selected_id = llm_result.get("selected_recipe_id")
-                    confidence = llm_result.get("confidence", 0.5)
-                    selection_warnings = llm_result.get("warnings", [])
-                    llm_alternatives = llm_result.get("alternatives", [])  # List of {recipe_id, confidence, reason}
-                    
-                    # Check if LLM failed (connection error, unavailable, etc.)
-                    llm_failed = any(w in ["LLM error", "LLM unavailable", "Empty LLM response"] for w in selection_warnings)
-                    
-                    if selected_id:
-                        # Find the selected candidate
-                        cand = next((c for c in candidates if c.get("id") == selected_id), None)
-                        if not cand:
-                            # Fallback if LLM selected invalid ID (shouldn't happen with validation)
+    runner = asyncio.Runner() if use_llm else None
+    try:
+        for day in days_sorted:
+            meal_results: Dict[str, MealSlotResult] = {}
+            # Gather candidates for every slot of the day first (the session is not shared across tasks)
+            day_slots: List[Tuple[str, Any, List[Dict[str, Any]], Dict[Any, Dict[str, Any]]]] = []
+            excluded = frozenset(used_recipe_ids)
+            for meal_key in MEAL_ORDER:
+                slot = day.meals.get(meal_key)
+                if not slot:
+                    continue
+                terms = _build_terms(slot)
+                candidates = search_fn(
+                    db=db,
+                    user_id=user_id,
+                    meal_type=meal_key,  # type: ignore[arg-type]
+                    tags_any=slot.tags or req.preferences.soft.tags,
+                    tags_all=[],
+                    include_terms=terms["include_terms"],
+                    exclude_terms=req.preferences.hard.excluded_ingredients + terms["exclude_terms"],
+                    max_prep_minutes=req.preferences.soft.max_prep_minutes,
+                    max_cook_minutes=req.preferences.soft.max_cook_minutes,
+                    exclude_recipe_ids=excluded,
+                    limit=25,
+                )
+                
+                # Debug logging
+                logger.info(
+                    f"Slot {slot_counter + len(day_slots) + 1} ({day.date} {meal_key}): "
+                    f"tags={slot.tags}, found {len(candidates)} candidates, "
+                    f"excluded={len(excluded)} recipes"
+                )
+                day_slots.append((meal_key, slot, candidates, {c.get("id"): c for c in candidates}))
+
+            # Ask the LLM for all of the day's slots at once
+            llm_results: Dict[str, Dict[str, Any]] = {}
+            if runner is not None:
+                llm_results = runner.run(
+                    _select_day_slots(day, day_slots, req, recent_meals)
+                )
+
+            for meal_key, slot, candidates, candidate_index in day_slots:
+                slot_counter += 1
+                selection = None
+                selection_warnings: List[str] = []
+                cand = None
+                confidence = None
+                llm_alternatives: List[Dict[str, Any]] = []
+                
+                if candidates:
+                    # Use LLM to select the best candidate
+                    if use_llm:
+                        llm_result = llm_results[meal_key]
+                        
+                        selected_id = llm_result.get("selected_recipe_id")
+                        confidence = llm_result.get("confidence", 0.5)
+                        selection_warnings = llm_result.get("warnings", [])
+                        llm_alternatives = llm_result.get("alternatives", [])  # List of {recipe_id, confidence, reason}
+                        
+                        # Check if LLM failed (connection error, unavailable, etc.)
+                        llm_failed = any(w in ["LLM error", "LLM unavailable", "Empty LLM response"] for w in selection_warnings)
+                        
+                        if selected_id and selected_id in used_recipe_ids:
+                            # An earlier slot today already took this recipe; promote the next-ranked alternative
+                            unused = [a for a in llm_alternatives if a.get("recipe_id") not in used_recipe_ids]
+                            if unused:
+                                selected_id = unused[0].get("recipe_id")
+                                confidence = unused[0].get("confidence", 0.5)
+                                llm_alternatives = unused[1:]
+                            else:
+                                # Every ranked pick is taken; fall back to the first unused candidate
+                                remaining = [c for c in candidates if c.get("id") not in used_recipe_ids]
+                                selected_id = remaining[0].get("id") if remaining else None
+                                confidence = None
+                                llm_alternatives = []
+                        
+                        if selected_id:
+                            # Find the selected candidate
+                            cand = candidate_index.get(selected_id)
+                            if not cand:
+                                # Fallback if LLM selected invalid ID (shouldn't happen with validation)
+                                slot_failures += 1
+                        elif llm_failed and candidates:
+                            # LLM failed to connect - fall back to deterministic selection
+                            remaining = [c for c in candidates if c.get("id") not in used_recipe_ids]
+                            cand = remaining[0] if remaining else None
+                            confidence = None
+                            selection_warnings.append("LLM unavailable, using deterministic selection")
+                            # Use remaining candidates as alternatives
+                            llm_alternatives = [
+                                {"recipe_id": c.get("id"), "confidence": 0.5, "reason": "Alternative option"}
+                                for c in remaining[1:3]
+                            ]
+                            if not cand:
+                                slot_failures += 1
+                        else:
+                            # LLM intentionally returned null (no good fit)
                             slot_failures += 1
-                    elif llm_failed and candidates:
-                        # LLM failed to connect - fall back to deterministic selection
-                        cand = candidates[0]
-                        confidence = None
-                        selection_warnings.append("LLM unavailable, using deterministic selection")
-                        # Use remaining candidates as alternatives
-                        llm_alternatives = [
-                            {"recipe_id": c.get("id"), "confidence": 0.5, "reason": "Alternative option"}
-                            for c in candidates[1:3]
-                        ]
                     else:
-                        # LLM intentionally returned null (no good fit)
-                        slot_failures += 1
+                        # Deterministic fallback: pick the first candidate not already used today
+                        cand = next((c for c in candidates if c.get("id") not in used_recipe_ids), None)
+                        if not cand:
+                            slot_failures += 1
+                    
+                    if cand:
+                        source = cand.get("source") or "user"
+                        recipe_id = cand.get("id")
+                        details = _details(source, recipe_id)
+                        selection_recipe_id = recipe_id
+                        if source == "core" and details:
+                            selection_recipe_id = stage_fn(db=db, user_id=user_id, source_recipe=details, request_id=request_id)
+                            selection_source = "stage"
+                        else:
+                            selection_source = source
+                        
+                        # Build alternatives list
+                        alternatives_list = []
+                        for alt in llm_alternatives:
+                            alt_id = alt.get("recipe_id")
+                            alt_cand = candidate_index.get(alt_id)
+                            if alt_cand:
+                                alt_source = alt_cand.get("source") or "user"
+                                alt_recipe_id = alt_id
+                                # Stage core recipes for alternatives too
+                                if alt_source == "core":
+                                    alt_details = _details(alt_source, alt_recipe_id)
+                                    if alt_details:
+                                        alt_recipe_id = stage_fn(db=db, user_id=user_id, source_recipe=alt_details, request_id=request_id)
+                                        alt_source = "stage"
+                                
+                                alternatives_list.append(Alternative(
+                                    source=alt_source,  # type: ignore[arg-type]
+                                    recipe_id=alt_recipe_id,
+                                    title=alt_cand.get("title", ""),
+                                    confidence=alt.get("confidence", 0.5),
+                                    reason=alt.get("reason"),
+                                    matched_tags=alt_cand.get("tags") or [],
+                                ))
+                        
+                        selection = Selection(
+                            source=selection_source,  # type: ignore[arg-type]
+                            recipe_id=selection_recipe_id,
+                            confidence=confidence,
+                            matched_tags=cand.get("tags") or [],
+                            warnings=selection_warnings,
+                            alternatives=alternatives_list,
+                        )
+                        used_recipe_ids.add(selection_recipe_id)
                 else:
-                    # Deterministic fallback: pick first candidate
-                    cand = candidates[0]
+                    slot_failures += 1
                 
-                if cand:
-                    source = cand.get("source") or "user"
-                    recipe_id = cand.get("id")
-                    details = details_fn(db=db, user_id=user_id, source=source, recipe_id=recipe_id)
-                    selection_recipe_id = recipe_id
-                    if source == "core" and details:
-                        selection_recipe_id = stage_fn(db=db, user_id=user_id, source_recipe=details, request_id=request_id)
-                        selection_source = "stage"
-                    else:
-                        selection_source = source
-                    
-                    # Build alternatives list
-                    alternatives_list = []
-                    for alt in llm_alternatives:
-                        alt_id = alt.get("recipe_id")
-                        alt_cand = next((c for c in candidates if c.get("id") == alt_id), None)
-                        if alt_cand:
-                            alt_source = alt_cand.get("source") or "user"
-                            alt_recipe_id = alt_id
-                            # Stage core recipes for alternatives too
-                            if alt_source == "core":
-                                alt_details = details_fn(db=db, user_id=user_id, source=alt_source, recipe_id=alt_recipe_id)
-                                if alt_details:
-                                    alt_recipe_id = stage_fn(db=db, user_id=user_id, source_recipe=alt_details, request_id=request_id)
-                                    alt_source = "stage"
-                            
-                            alternatives_list.append(Alternative(
-                                source=alt_source,  # type: ignore[arg-type]
-                                recipe_id=alt_recipe_id,
-                                title=alt_cand.get("title", ""),
-                                confidence=alt.get("confidence", 0.5),
-                                reason=alt.get("reason"),
-                                matched_tags=alt_cand.get("tags") or [],
-                            ))
-                    
-                    selection = Selection(
-                        source=selection_source,  # type: ignore[arg-type]
-                        recipe_id=selection_recipe_id,
-                        confidence=confidence,
-                        matched_tags=cand.get("tags") or [],
-                        warnings=selection_warnings,
-                        alternatives=alternatives_list,
+                meal_results[meal_key] = MealSlotResult(**slot.model_dump(), selection=selection)
+                progress_batch += 1
+                if progress_batch >= progress_every:
+                    mailbox_service.publish(
+                        db,
+                        user_id,
+                        "meal_plan_generation_progress",
+                        {"request_id": request_id, "processed_slots": slot_counter},
                     )
-                    used_recipe_ids.add(selection_recipe_id)
-            else:
-                slot_failures += 1
-            
-            meal_results[meal_key] = MealSlotResult(**slot.model_dump(), selection=selection)
-            progress_batch += 1
-            if progress_batch >= progress_every:
-                mailbox_service.publish(
-                    db,
-                    user_id,
-                    "meal_plan_generation_progress",
-                    {"request_id": request_id, "processed_slots": slot_counter},
-                )
-                progress_batch = 0
-        day_results.append(DayResult(date=day.date, meals=meal_results))  # type: ignore[arg-type]
+                    progress_batch = 0
+            day_results.append(DayResult(date=day.date, meals=meal_results))  # type: ignore[arg-type]
+    finally:
+        if runner is not None:
+            # The pooled LLM client is bound to this runner's loop; close it before the loop goes.
+            try:
+                runner.run(llm_client.aclose_llm_client())
+            finally:
+                runner.close()
+
+    if pending_stage_rows:
+        db.execute(insert(models.StageRecipe), pending_stage_rows)
+        db.commit()
 
     return MealPlanResult(days=day_results), slot_failures
 
 
-def publish_completed(db: Session, user_id: str, request_id: str, result: MealPlanResult, slot_failures: int) -> None:
+def publish_completed(
+    db: Session,
+    user_id: str,
+    request_id: str,
+    result: MealPlanResult,
+    slot_failures: int,
+    *,
+    commit: bool = True,
+) -> None:
     status = "partial" if slot_failures > 0 else "completed"
     result_payload = result.model_dump(mode="json")
     mailbox_service.publish(
@@ -403,6 +536,7 @@ def publish_completed(db: Session, user_id: str, request_id: str, result: MealPl
             "slot_failures_count": slot_failures,
             "result": result_payload,
         },
+        commit=commit,
     )
 
 
@@ -417,36 +551,33 @@ def publish_failed(db: Session, user_id: str, request_id: str, error_code: str,
 
 def cleanup_expired_stage_recipes(db: Session, cutoff_hours: int = 72, mark_jobs: bool = False) -> Tuple[int, int]:
     now = datetime.utcnow()
-    expired = (
-        db.query(models.StageRecipe)
-        .filter(models.StageRecipe.expires_at <= now)
-        .all()
-    )
-    request_ids = {s.request_id for s in expired if s.request_id}
-    deleted = 0
-    if expired:
-        deleted = (
-            db.query(models.StageRecipe)
-            .filter(models.StageRecipe.id.in_([s.id for s in expired]))
-            .delete(synchronize_session=False)
-        )
+    expired = db.query(models.StageRecipe).filter(models.StageRecipe.expires_at <= now)
+    request_ids: set[str] = set()
+    if mark_jobs:
+        request_ids = {
+            request_id
+            for (request_id,) in expired.filter(models.StageRecipe.request_id.isnot(None)).with_entities(
+                models.StageRecipe.request_id
+            )
+        }
+    deleted = expired.delete(synchronize_session=False)
     abandoned_jobs = 0
     if mark_jobs and request_ids:
-        jobs = (
-            db.query(models.RecipeParseJob)
-            .filter(models.RecipeParseJob.job_type == "meal_plan_generate")
-            .all()
-        )
-        for job in jobs:
-            data = job.job_data or {}
-            if data.get("request_id") in request_ids and job.status not in {
-                "ABANDONED",
-                "COMPLETED",
-            }:
-                job.status = "ABANDONED"
-                job.abandoned_at = now
-                abandoned_jobs += 1
-        db.commit()
+        job_request_id = models.RecipeParseJob.job_data["request_id"].as_string()
+        pending_ids = sorted(request_ids)
+        for start in range(0, len(pending_ids), CLEANUP_BATCH_SIZE):
+            abandoned_jobs += (
+                db.query(models.RecipeParseJob)
+                .filter(
+                    models.RecipeParseJob.job_type == "meal_plan_generate",
+                    models.RecipeParseJob.status.notin_(("ABANDONED", "COMPLETED")),
+                    job_request_id.in_(pending_ids[start : start + CLEANUP_BATCH_SIZE]),
+                )
+                .update(
+                    {models.RecipeParseJob.status: "ABANDONED", models.RecipeParseJob.abandoned_at: now},
+                    synchronize_session=False,
+                )
+            )
     db.commit()
     return deleted or 0, abandoned_jobs
 
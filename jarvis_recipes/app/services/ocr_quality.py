@@ -1,17 +1,30 @@
 import re
+import string
 from typing import Dict
 
+_TOKEN = re.compile(r"[A-Za-z]{2,}")
+_VOWELS = "AEIOUaeiou"
+_VOWEL_SET = frozenset(_VOWELS)
+# Deletion tables: counting is len(before) - len(after), done in C by str.translate
+_DROP_ALPHA = str.maketrans("", "", string.ascii_letters)
+_DROP_VOWELS = str.maketrans("", "", _VOWELS)
+_ING_LINE = re.compile(r"^\s*[\d\-\/\.\s]+[a-zA-Z]?")
+_STEP_LINE = re.compile(r"^\s*\d+[\).\s]")
+_KEYWORDS = ("ingredients", "directions", "instructions", "method", "serves", "yield")
+_KEYWORD_RE = re.compile("|".join(_KEYWORDS), re.IGNORECASE)
+
 
 def _gibberish_flags(text: str) -> Dict[str, float | bool]:
-    alpha_chars = len(re.findall(r"[A-Za-z]", text))
     total_chars = len(text)
+    alpha_chars = total_chars - len(text.translate(_DROP_ALPHA))
     alpha_ratio = alpha_chars / total_chars if total_chars else 0.0
 
-    tokens = re.findall(r"[A-Za-z]{2,}", text)
+    tokens = _TOKEN.findall(text)
     token_chars = sum(len(t) for t in tokens) or 1
-    vowels = sum(len(re.findall(r"[AEIOUaeiou]", t)) for t in tokens)
+    joined = "".join(tokens)
+    vowels = len(joined) - len(joined.translate(_DROP_VOWELS))
     vowel_ratio = vowels / token_chars
-    vowelful_tokens = sum(1 for t in tokens if re.search(r"[AEIOUaeiou]", t))
+    vowelful_tokens = sum(1 for t in tokens if not _VOWEL_SET.isdisjoint(t))
 
     # Heuristic: tighten thresholds to reject nonsensical OCR blobs
     is_gibberish = (
@@ -29,41 +42,55 @@ def _gibberish_flags(text: str) -> Dict[str, float | bool]:
     }
 
 
-def score_quality(text: str, mean_confidence: float | None) -> Dict[str, int | bool | float]:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+def score_quality(text: str, mean_confidence: float | None) -> Dict[str, int | bool | float | None]:
     char_count = len(text)
+    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
     line_count = len(lines)
 
-    hard_fail = char_count < 500 or line_count < 10
+    if char_count < 500 or line_count < 10:
+        # Too little text to be a recipe; skip the gibberish and scoring passes
+        return {
+            "char_count": char_count,
+            "line_count": line_count,
+            "hard_fail": True,
+            "gibberish": False,
+            "alpha_ratio": None,
+            "vowel_ratio": None,
+            "token_count": None,
+            "vowelful_tokens": None,
+            "score": 0,
+            "pass_gate": False,
+            "warnings": [],
+        }
+
     gib = _gibberish_flags(text)
 
     score = 0
     if mean_confidence is not None and mean_confidence >= 50:
         score += 1
 
-    keywords = {"ingredients", "directions", "instructions", "method", "serves", "yield"}
-    if sum(1 for ln in lines if any(kw in ln.lower() for kw in keywords)) >= 2:
+    if sum(1 for ln in lines if _KEYWORD_RE.search(ln)) >= 2:
         score += 1
 
-    ingredient_like = any(re.search(r"^\s*[\d\-\/\.\s]+[a-zA-Z]?", ln) for ln in lines)
+    ingredient_like = any(_ING_LINE.search(ln) for ln in lines)
     if ingredient_like:
         score += 1
 
-    step_like = any(re.match(r"^\s*\d+[\).\s]", ln) for ln in lines)
+    step_like = any(_STEP_LINE.match(ln) for ln in lines)
     if step_like:
         score += 1
 
     return {
         "char_count": char_count,
         "line_count": line_count,
-        "hard_fail": hard_fail or gib["is_gibberish"],
+        "hard_fail": gib["is_gibberish"],
         "gibberish": gib["is_gibberish"],
         "alpha_ratio": gib["alpha_ratio"],
         "vowel_ratio": gib["vowel_ratio"],
         "token_count": gib["token_count"],
         "vowelful_tokens": gib["vowelful_tokens"],
         "score": score,
-        "pass_gate": (not hard_fail) and score >= 2 and not gib["is_gibberish"],
+        "pass_gate": score >= 2 and not gib["is_gibberish"],
         "warnings": [],
     }
 
@@ -6,17 +6,73 @@ which provides OCR capabilities via multiple providers including traditional OCR
 (Tesseract, EasyOCR, PaddleOCR, Apple Vision) and LLM-based providers
 (llm_proxy_vision, llm_proxy_cloud).
 """
+import asyncio
 import base64
+import hashlib
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from statistics import fmean
 from typing import Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 
 from jarvis_recipes.app.core import service_config
 from jarvis_recipes.app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Dedicated pool for request-body encoding (base64 + JSON of every image) so the
+# event loop stays responsive and the default executor stays free for S3 I/O.
+_ENCODE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ocr-encode")
+
+_OCR_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+# Shared client for OCR service calls, bound to the event loop that created it.
+_ocr_client: Optional[httpx.AsyncClient] = None
+_ocr_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the pooled OCR service client; timeouts are passed per request."""
+    global _ocr_client, _ocr_client_loop
+    loop = asyncio.get_running_loop()
+    if _ocr_client is None or _ocr_client.is_closed or _ocr_client_loop is not loop:
+        _ocr_client = httpx.AsyncClient(limits=_OCR_LIMITS)
+        _ocr_client_loop = loop
+    return _ocr_client
+
+
+# Successful batch results keyed by a hash of the images and request options, so job
+# retries and duplicate uploads handled by this process skip the OCR round trip.
+# In-process only: it helps the long-lived polling worker (scripts/run_parse_worker.py).
+# The RQ worker forks a fresh process per job, so entries never outlive the job there.
+_OCR_CACHE_MAX_ENTRIES = 64
+_ocr_result_cache: "OrderedDict[str, Tuple[str, Optional[float], Optional[str], List[Dict]]]" = OrderedDict()
+
+
+def _batch_cache_key(
+    image_bytes_list: List[bytes],
+    provider: str,
+    content_type: str,
+    language_hints: Optional[List[str]],
+) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{provider}|{content_type}|{','.join(language_hints or ['en'])}".encode("utf-8"))
+    for img_bytes in image_bytes_list:
+        digest.update(len(img_bytes).to_bytes(8, "big"))
+        digest.update(img_bytes)
+    return digest.hexdigest()
+
+
+async def aclose_ocr_client() -> None:
+    """Close the shared OCR service client (application shutdown)."""
+    global _ocr_client, _ocr_client_loop
+    if _ocr_client is not None and _ocr_client_loop is asyncio.get_running_loop():
+        await _ocr_client.aclose()
+    _ocr_client = None
+    _ocr_client_loop = None
+
 
 def _get_auth_headers() -> Dict[str, str]:
     """Get authentication headers for OCR service (same as LLM proxy)."""
@@ -29,6 +85,29 @@ def _get_auth_headers() -> Dict[str, str]:
     }
 
 
+def _encode_batch_body(
+    image_bytes_list: List[bytes],
+    provider: str,
+    content_type: str,
+    language_hints: Optional[List[str]],
+) -> bytes:
+    """Build the JSON body for /v1/ocr/batch (CPU-bound for large images)."""
+    # Encode all images to base64 (ASCII-only, so orjson writes it straight into the body)
+    payload = {
+        "provider": provider,
+        "images": [
+            {"content_type": content_type, "base64": base64.b64encode(img_bytes).decode("ascii")}
+            for img_bytes in image_bytes_list
+        ],
+        "options": {
+            "language_hints": language_hints or ["en"],
+            "return_boxes": False,  # We don't need boxes for recipe extraction
+            "mode": "document",
+        },
+    }
+    return orjson.dumps(payload)
+
+
 async def call_ocr_service_batch(
     image_bytes_list: List[bytes],
     provider: str = "auto",
@@ -64,23 +143,20 @@ async def call_ocr_service_batch(
     if len(image_bytes_list) > 100:
         raise ValueError("Maximum 100 images per batch request")
 
-    # Encode all images to base64
-    images_payload = []
-    for img_bytes in image_bytes_list:
-        images_payload.append({
-            "content_type": content_type,
-            "base64": base64.b64encode(img_bytes).decode("utf-8"),
-        })
-
-    payload = {
-        "provider": provider,
-        "images": images_payload,
-        "options": {
-            "language_hints": language_hints or ["en"],
-            "return_boxes": False,  # We don't need boxes for recipe extraction
-            "mode": "document",
-        },
-    }
+    loop = asyncio.get_running_loop()
+    cache_key = await loop.run_in_executor(
+        _ENCODE_POOL, _batch_cache_key, image_bytes_list, provider, content_type, language_hints
+    )
+    cached = _ocr_result_cache.get(cache_key)
+    if cached is not None:
+        _ocr_result_cache.move_to_end(cache_key)
+        combined_text, mean_confidence, provider_used, metadata_list = cached
+        logger.info("OCR service batch cache hit: images=%d, text_len=%d", len(image_bytes_list), len(combined_text))
+        return combined_text, mean_confidence, provider_used, [dict(meta) for meta in metadata_list]
+
+    body = await loop.run_in_executor(
+        _ENCODE_POOL, _encode_batch_body, image_bytes_list, provider, content_type, language_hints
+    )
 
     url = f"{ocr_url.rstrip('/')}/v1/ocr/batch"
     headers = {
@@ -90,8 +166,7 @@ async def call_ocr_service_batch(
 
     try:
         timeout = httpx.Timeout(timeout_seconds, read=timeout_seconds, connect=20.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.post(url, json=payload, headers=headers)
+        resp = await _get_client().post(url, content=body, headers=headers, timeout=timeout)
 
         if resp.status_code >= 400:
             logger.warning(
@@ -116,23 +191,25 @@ async def call_ocr_service_batch(
             if text:
                 texts.append(text)
             
-            # Calculate mean confidence from blocks for this image
-            blocks = result.get("blocks", [])
-            if blocks:
-                img_confidences = [block.get("confidence", 0.0) for block in blocks if "confidence" in block]
-                if img_confidences:
-                    # Convert from 0-1 to 0-100 scale if needed
-                    mean_img_conf = sum(img_confidences) / len(img_confidences)
-                    if mean_img_conf <= 1.0:
-                        mean_img_conf = mean_img_conf * 100
-                    confidences.append(mean_img_conf)
+            # Mean confidence from blocks for this image (running sum, no per-image list)
+            conf_sum = 0.0
+            conf_count = 0
+            for block in result.get("blocks") or ():
+                if "confidence" in block:
+                    conf_sum += block["confidence"]
+                    conf_count += 1
+            if conf_count:
+                # Convert from 0-1 to 0-100 scale if needed
+                mean_img_conf = conf_sum / conf_count
+                if mean_img_conf <= 1.0:
+                    mean_img_conf = mean_img_conf * 100
+                confidences.append(mean_img_conf)
             
             # Store metadata for this image
-            img_meta = result.get("meta", {})
-            metadata_list.append(img_meta)
+            metadata_list.append(result.get("meta", {}))
 
         combined_text = "\n\n".join(texts)
-        mean_confidence = sum(confidences) / len(confidences) if confidences else None
+        mean_confidence = fmean(confidences) if confidences else None
 
         logger.info(
             "OCR service batch success: provider=%s, images=%d, text_len=%d, confidence=%s, duration_ms=%s",
@@ -143,7 +220,12 @@ async def call_ocr_service_batch(
             batch_meta.get("total_duration_ms"),
         )
 
-        return combined_text, mean_confidence, provider_used, metadata_list
+        if combined_text:
+            _ocr_result_cache[cache_key] = (combined_text, mean_confidence, provider_used, metadata_list)
+            if len(_ocr_result_cache) > _OCR_CACHE_MAX_ENTRIES:
+                _ocr_result_cache.popitem(last=False)
+
+        return combined_text, mean_confidence, provider_used, [dict(meta) for meta in metadata_list]
 
     except httpx.TimeoutException:
         logger.warning("OCR service batch request timed out after %ds", timeout_seconds)
@@ -1,4 +1,3 @@
-import json
 import logging
 import re
 import uuid
@@ -6,7 +5,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional, Tuple
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
 from jarvis_recipes.app.db import models
@@ -14,9 +13,8 @@ from jarvis_recipes.app.services import queue_service, url_recipe_parser
 
 logger = logging.getLogger(__name__)
 
-
-def _split_qty_unit(qty: str) -> Tuple[str | None, str | None]:
-    units = {
+_UNITS = frozenset(
+    {
         "cup",
         "cups",
         "teaspoon",
@@ -57,6 +55,11 @@ def _split_qty_unit(qty: str) -> Tuple[str | None, str | None]:
         "piece",
         "pieces",
     }
+)
+_QTY_STARTS_DIGIT = re.compile(r"^[0-9/]")
+
+
+def _split_qty_unit(qty: str) -> Tuple[str | None, str | None]:
     if not qty:
         return None, None
     raw_tokens = qty.replace("(", " ").replace(")", " ").replace(",", " ").split()
@@ -67,11 +70,11 @@ def _split_qty_unit(qty: str) -> Tuple[str | None, str | None]:
     def _should_split(qty_part: str) -> bool:
         if not qty_part:
             return True  # allow cases like "pinch salt"
-        return bool(re.match(r"^[0-9/]", qty_part))
+        return bool(_QTY_STARTS_DIGIT.match(qty_part))
 
     for idx, tok in enumerate(tokens[:3]):
         tok_clean = tok.lower().strip(".,")
-        if tok_clean in units:
+        if tok_clean in _UNITS:
             qty_part = " ".join(tokens[:idx]).strip()
             if not _should_split(qty_part):
                 continue
@@ -79,7 +82,7 @@ def _split_qty_unit(qty: str) -> Tuple[str | None, str | None]:
     # Fallback: check trailing token
     last_raw = tokens[-1]
     last_clean = last_raw.lower().strip(".,")
-    if last_clean in units:
+    if last_clean in _UNITS:
         qty_part = " ".join(tokens[:-1]).strip()
         if _should_split(qty_part):
             return qty_part or None, last_raw.rstrip(".,")
@@ -150,17 +153,47 @@ def get_job_for_user(db: Session, job_id: str, user_id: str) -> Optional[models.
     return db.scalars(stmt).first()
 
 
-def fetch_next_pending(db: Session, job_type: str = "url") -> Optional[models.RecipeParseJob]:
-    stmt = (
-        select(models.RecipeParseJob)
+def claim_next_pending(db: Session, job_type: str = "url") -> Optional[models.RecipeParseJob]:
+    """
+    Atomically claim the oldest pending job of a type and mark it running.
+
+    The oldest PENDING row is picked with FOR UPDATE SKIP LOCKED (ignored on SQLite)
+    and flipped to RUNNING in the same UPDATE ... RETURNING, so concurrent workers
+    never pick up the same job.
+    """
+    next_id = (
+        select(models.RecipeParseJob.id)
         .where(
             models.RecipeParseJob.status == RecipeParseJobStatus.PENDING.value,
             models.RecipeParseJob.job_type == job_type,
         )
         .order_by(models.RecipeParseJob.created_at.asc())
         .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
     )
-    return db.scalars(stmt).first()
+    stmt = (
+        update(models.RecipeParseJob)
+        .where(
+            models.RecipeParseJob.id == next_id,
+            models.RecipeParseJob.status == RecipeParseJobStatus.PENDING.value,
+        )
+        .values(
+            status=RecipeParseJobStatus.RUNNING.value,
+            started_at=datetime.utcnow(),
+            attempts=func.coalesce(models.RecipeParseJob.attempts, 0) + 1,
+        )
+        .returning(models.RecipeParseJob)
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        job = db.scalars(stmt).first()
+        db.commit()
+    except Exception as exc:
+        logger.exception("Failed to claim %s job: %s", job_type, exc)
+        db.rollback()
+        raise
+    return job
 
 
 def is_canceled(job: models.RecipeParseJob) -> bool:
@@ -168,76 +201,137 @@ def is_canceled(job: models.RecipeParseJob) -> bool:
     return job.status == RecipeParseJobStatus.CANCELED.value
 
 
-def mark_running(db: Session, job: models.RecipeParseJob) -> None:
-    """Mark a job as running, but only if it's not in a terminal state."""
-    if job.status in {s.value for s in (RecipeParseJobStatus.CANCELED, RecipeParseJobStatus.COMMITTED, RecipeParseJobStatus.ABANDONED)}:
-        return
-    job.status = RecipeParseJobStatus.RUNNING.value
-    job.started_at = datetime.utcnow()
-    job.attempts = (job.attempts or 0) + 1
+def load_job_with_ingestion(
+    db: Session, job_id: str
+) -> Tuple[Optional[models.RecipeParseJob], Optional[models.RecipeIngestion]]:
+    """
+    Load a job and the ingestion named by its ``job_data["ingestion_id"]`` in one query.
+
+    The ingestion is None when the job carries no ingestion_id or it doesn't resolve.
+    """
+    stmt = (
+        select(models.RecipeParseJob, models.RecipeIngestion)
+        .outerjoin(
+            models.RecipeIngestion,
+            models.RecipeIngestion.id == models.RecipeParseJob.job_data["ingestion_id"].as_string(),
+        )
+        .where(models.RecipeParseJob.id == job_id)
+    )
+    row = db.execute(stmt).first()
+    if row is None:
+        return None, None
+    return row[0], row[1]
+
+
+def is_job_canceled(db: Session, job_id: str) -> bool:
+    """Read just the job's current status from the DB, without reloading the ORM object."""
+    status = db.scalar(select(models.RecipeParseJob.status).where(models.RecipeParseJob.id == job_id))
+    return status == RecipeParseJobStatus.CANCELED.value
+
+
+# Jobs in these states are never moved by the worker-side transitions
+_LOCKED_STATUSES = frozenset(
+    s.value for s in (RecipeParseJobStatus.CANCELED, RecipeParseJobStatus.COMMITTED, RecipeParseJobStatus.ABANDONED)
+)
+
+
+def _transition(db: Session, job: models.RecipeParseJob, guard, values: dict, action: str) -> bool:
+    """
+    Apply a status transition as a single guarded UPDATE and commit it.
+
+    The guard is part of the WHERE clause, so a concurrent cancel/commit can't be
+    overwritten. No session sync or refresh is done: the job is expired after the
+    commit (even on sessions with expire_on_commit=False), so its attributes
+    reload lazily only if a caller reads them afterwards.
+    """
+    job_id = job.id
+    stmt = (
+        update(models.RecipeParseJob)
+        .where(models.RecipeParseJob.id == job_id, guard)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
     try:
+        updated = db.execute(stmt).rowcount or 0
         db.commit()
-        db.refresh(job)
+        db.expire(job)
     except Exception as exc:
-        logger.exception("Failed to mark job %s as running: %s", job.id, exc)
+        logger.exception("Failed to mark job %s as %s: %s", job_id, action, exc)
         db.rollback()
         raise
+    return updated > 0
+
+
+def mark_running(db: Session, job: models.RecipeParseJob) -> None:
+    """Mark a job as running, but only if it's not in a terminal state."""
+    if job.status in _LOCKED_STATUSES:
+        return
+    _transition(
+        db,
+        job,
+        models.RecipeParseJob.status.notin_(_LOCKED_STATUSES),
+        {
+            "status": RecipeParseJobStatus.RUNNING.value,
+            "started_at": datetime.utcnow(),
+            "attempts": func.coalesce(models.RecipeParseJob.attempts, 0) + 1,
+        },
+        "running",
+    )
+
+
+def _ingredient_to_draft(ing: dict) -> dict:
+    raw_qty = ing.get("quantity_display") or ing.get("quantity")
+    qty_val, unit_val = _split_qty_unit(raw_qty) if raw_qty else (None, None)
+    return {
+        "name": ing.get("text") or ing.get("name") or ing.get("label") or "",
+        "quantity": qty_val or raw_qty,
+        "unit": ing.get("unit") or unit_val,
+        "notes": None,
+    }
+
+
+def _recipe_dict_to_draft(recipe: dict, source_type: str) -> dict:
+    ingredients = [_ingredient_to_draft(ing) for ing in recipe.get("ingredients") or []]
+    est_time = (
+        recipe.get("estimated_time_minutes")
+        or recipe.get("total_time_minutes")
+        or recipe.get("cook_time_minutes")
+        or recipe.get("totalTime")
+        or 0
+    )
+    prep_time = recipe.get("prep_time_minutes") or recipe.get("prepTime") or 0
+    cook_time = recipe.get("cook_time_minutes") or recipe.get("cookTime") or est_time
+    total_time = recipe.get("total_time_minutes") or (prep_time + cook_time if (prep_time or cook_time) else est_time)
+    source_obj = recipe.get("source") or {}
+    return {
+        "title": recipe.get("title") or "Untitled",
+        "description": recipe.get("description"),
+        "ingredients": ingredients,
+        "steps": recipe.get("steps") or [],
+        "prep_time_minutes": prep_time,
+        "cook_time_minutes": cook_time,
+        "total_time_minutes": total_time,
+        "servings": recipe.get("servings"),
+        "tags": recipe.get("tags") or [],
+        "source": {
+            "type": source_obj.get("type") or source_type,
+            "source_url": source_obj.get("source_url") or recipe.get("source_url"),
+            "image_url": source_obj.get("image_url") or recipe.get("image_url"),
+        },
+    }
 
 
 def mark_complete(db: Session, job: models.RecipeParseJob, result: url_recipe_parser.ParseResult) -> None:
-    if job.status in {s.value for s in (RecipeParseJobStatus.CANCELED, RecipeParseJobStatus.COMMITTED, RecipeParseJobStatus.ABANDONED)}:
+    if job.status in _LOCKED_STATUSES:
         return
-    job.status = RecipeParseJobStatus.COMPLETE.value
-    job.completed_at = datetime.utcnow()
-    payload = json.loads(result.model_dump_json())
-
-    def _recipe_dict_to_draft(recipe: dict, source_type: str) -> dict:
-        ingredients = []
-        for ing in recipe.get("ingredients") or []:
-            qty_val = ing.get("quantity_display") or ing.get("quantity")
-            qty_val, unit_val = _split_qty_unit(qty_val) if qty_val else (None, None)
-            ingredients.append(
-                {
-                    "name": ing.get("text") or ing.get("name") or ing.get("label") or "",
-                    "quantity": qty_val or ing.get("quantity_display") or ing.get("quantity"),
-                    "unit": ing.get("unit") or unit_val,
-                    "notes": None,
-                }
-            )
-        est_time = (
-            recipe.get("estimated_time_minutes")
-            or recipe.get("total_time_minutes")
-            or recipe.get("cook_time_minutes")
-            or recipe.get("totalTime")
-            or 0
-        )
-        prep_time = recipe.get("prep_time_minutes") or recipe.get("prepTime") or 0
-        cook_time = recipe.get("cook_time_minutes") or recipe.get("cookTime") or est_time
-        total_time = recipe.get("total_time_minutes") or (prep_time + cook_time if (prep_time or cook_time) else est_time)
-        source_obj = recipe.get("source") or {}
-        return {
-            "title": recipe.get("title") or "Untitled",
-            "description": recipe.get("description"),
-            "ingredients": ingredients,
-            "steps": recipe.get("steps") or [],
-            "prep_time_minutes": prep_time,
-            "cook_time_minutes": cook_time,
-            "total_time_minutes": total_time,
-            "servings": recipe.get("servings"),
-            "tags": recipe.get("tags") or [],
-            "source": {
-                "type": source_obj.get("type") or source_type,
-                "source_url": source_obj.get("source_url") or recipe.get("source_url"),
-                "image_url": source_obj.get("image_url") or recipe.get("image_url"),
-            },
-        }
+    payload = result.model_dump(mode="json")
 
     if job.job_type in {"url", "ingestion", "image"}:
         recipe = payload.get("recipe") or payload.get("recipe_draft") or {}
         source_type = "url" if job.job_type in {"url", "ingestion"} else "ocr"
         recipe_draft = _recipe_dict_to_draft(recipe, source_type)
         pipe = payload.get("pipeline") or {}
-        job.result_json = {
+        result_json = {
             "recipe_draft": recipe_draft,
             "pipeline": {
                 "parser_strategy": pipe.get("parser_strategy") or payload.get("parser_strategy"),
@@ -252,59 +346,65 @@ def mark_complete(db: Session, job: models.RecipeParseJob, result: url_recipe_pa
             },
         }
     else:
-        job.result_json = payload
-    try:
-        db.commit()
-        db.refresh(job)
-    except Exception as exc:
-        logger.exception("Failed to mark job %s as complete: %s", job.id, exc)
-        db.rollback()
-        raise
+        result_json = payload
+    _transition(
+        db,
+        job,
+        models.RecipeParseJob.status.notin_(_LOCKED_STATUSES),
+        {
+            "status": RecipeParseJobStatus.COMPLETE.value,
+            "completed_at": datetime.utcnow(),
+            "result_json": result_json,
+        },
+        "complete",
+    )
 
 
 def mark_error(db: Session, job: models.RecipeParseJob, error_code: str, error_message: str) -> None:
-    if job.status in {s.value for s in (RecipeParseJobStatus.CANCELED, RecipeParseJobStatus.COMMITTED, RecipeParseJobStatus.ABANDONED)}:
+    if job.status in _LOCKED_STATUSES:
         return
-    job.status = RecipeParseJobStatus.ERROR.value
-    job.completed_at = datetime.utcnow()
-    job.error_code = error_code
-    job.error_message = error_message
-    try:
-        db.commit()
-        db.refresh(job)
-    except Exception as exc:
-        logger.exception("Failed to mark job %s as error: %s", job.id, exc)
-        db.rollback()
-        raise
+    _transition(
+        db,
+        job,
+        models.RecipeParseJob.status.notin_(_LOCKED_STATUSES),
+        {
+            "status": RecipeParseJobStatus.ERROR.value,
+            "completed_at": datetime.utcnow(),
+            "error_code": error_code,
+            "error_message": error_message,
+        },
+        "error",
+    )
 
 
 def mark_committed(db: Session, job: models.RecipeParseJob) -> None:
     if job.status != RecipeParseJobStatus.COMPLETE.value:
         return
-    job.status = RecipeParseJobStatus.COMMITTED.value
-    job.committed_at = datetime.utcnow()
-    db.commit()
-    db.refresh(job)
+    _transition(
+        db,
+        job,
+        models.RecipeParseJob.status == RecipeParseJobStatus.COMPLETE.value,
+        {"status": RecipeParseJobStatus.COMMITTED.value, "committed_at": datetime.utcnow()},
+        "committed",
+    )
+
+
+_CANCELABLE_STATUSES = frozenset(
+    s.value for s in (RecipeParseJobStatus.PENDING, RecipeParseJobStatus.RUNNING, RecipeParseJobStatus.COMPLETE)
+)
 
 
 def mark_canceled(db: Session, job: models.RecipeParseJob) -> bool:
     """Mark a job as canceled. Allows canceling PENDING, RUNNING, and COMPLETE jobs."""
-    if job.status not in {
-        RecipeParseJobStatus.PENDING.value,
-        RecipeParseJobStatus.RUNNING.value,
-        RecipeParseJobStatus.COMPLETE.value,
-    }:
+    if job.status not in _CANCELABLE_STATUSES:
         return False
-    job.status = RecipeParseJobStatus.CANCELED.value
-    job.canceled_at = datetime.utcnow()
-    try:
-        db.commit()
-        db.refresh(job)
-        return True
-    except Exception as exc:
-        logger.exception("Failed to mark job %s as canceled: %s", job.id, exc)
-        db.rollback()
-        raise
+    return _transition(
+        db,
+        job,
+        models.RecipeParseJob.status.in_(_CANCELABLE_STATUSES),
+        {"status": RecipeParseJobStatus.CANCELED.value, "canceled_at": datetime.utcnow()},
+        "canceled",
+    )
 
 
 def abandon_stale_jobs(db: Session, cutoff_minutes: int) -> int:
@@ -1,7 +1,7 @@
 from datetime import timedelta
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from jarvis_recipes.app.db import models
@@ -13,6 +13,10 @@ from jarvis_recipes.app.schemas.planner import (
 )
 
 
+_MEAL_TYPES = ("breakfast", "lunch", "dinner")
+_MEAL_TITLES = {meal: f"{meal.title()} idea" for meal in _MEAL_TYPES}
+
+
 def _ensure_user(db: Session, user_id: int) -> models.User:
     user_id_str = str(user_id)
     user = db.get(models.User, user_id_str)
@@ -24,28 +28,34 @@ def _ensure_user(db: Session, user_id: int) -> models.User:
 
 
 def draft_plan(data: PlannerDraftRequest) -> PlannerDraftResponse:
-    items = []
-    meal_types = ["breakfast", "lunch", "dinner"]
-    current = data.start_date
-    while current <= data.end_date:
-        for meal in meal_types:
-            items.append(PlannerDraftItem(date=current, meal_type=meal, title=f"{meal.title()} idea"))
-        current += timedelta(days=1)
+    n_days = (data.end_date - data.start_date).days + 1
+    items = [
+        PlannerDraftItem(date=day, meal_type=meal, title=_MEAL_TITLES[meal])
+        for day in (data.start_date + timedelta(days=n) for n in range(n_days))
+        for meal in _MEAL_TYPES
+    ]
     return PlannerDraftResponse(items=items)
 
 
 def commit_plan(db: Session, user_id: str, data: MealPlanCreate) -> models.MealPlan:
     _ensure_user(db, user_id)
     meal_plan = models.MealPlan(user_id=str(user_id), name=data.name, start_date=data.start_date)
-    for item in data.items:
-        meal_plan.items.append(
-            models.MealPlanItem(
-                date=item.date,
-                meal_type=item.meal_type,
-                recipe_id=item.recipe_id,
-            )
-        )
     db.add(meal_plan)
+    db.flush()
+    if data.items:
+        # One executemany instead of a unit-of-work INSERT per item.
+        db.execute(
+            insert(models.MealPlanItem),
+            [
+                {
+                    "meal_plan_id": meal_plan.id,
+                    "date": item.date,
+                    "meal_type": item.meal_type,
+                    "recipe_id": item.recipe_id,
+                }
+                for item in data.items
+            ],
+        )
     db.commit()
     db.refresh(meal_plan)
     return meal_plan
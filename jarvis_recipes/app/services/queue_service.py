@@ -5,12 +5,13 @@ This module provides a Redis-based queue using RQ (Redis Queue) with
 the baton-pass workflow pattern. Jobs use a standardized envelope format
 and are routed to appropriate queues (jarvis.recipes.jobs or jarvis.ocr.jobs).
 """
-import json
+import functools
 import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from redis import Redis
+import orjson
+from redis import BlockingConnectionPool, Redis
 from rq import Queue
 
 from jarvis_recipes.app.core.config import get_settings
@@ -21,32 +22,33 @@ logger = logging.getLogger(__name__)
 QUEUE_RECIPES = "jarvis.recipes.jobs"
 QUEUE_OCR = "jarvis.ocr.jobs"
 
-# Global Redis connection and queues
-_redis_conn: Optional[Redis] = None
-_queues: Dict[str, Queue] = {}
+# Seconds a caller waits for a free pooled connection before erroring
+REDIS_POOL_TIMEOUT = 5
 
 
+@functools.cache
 def get_redis_connection() -> Redis:
-    """Get or create Redis connection."""
-    global _redis_conn
-    if _redis_conn is None:
-        settings = get_settings()
-        _redis_conn = Redis(
-            host=settings.redis_host,
-            port=settings.redis_port,
-            password=settings.redis_password,
-            decode_responses=False,  # RQ expects bytes
-        )
-    return _redis_conn
+    """Get or create Redis connection.
+
+    Backed by a bounded, blocking pool: under a burst of enqueues callers wait
+    briefly for a free connection instead of opening an unbounded number.
+    """
+    settings = get_settings()
+    pool = BlockingConnectionPool(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        password=settings.redis_password,
+        max_connections=settings.redis_pool_size,
+        timeout=REDIS_POOL_TIMEOUT,
+        decode_responses=False,  # RQ expects bytes
+    )
+    return Redis(connection_pool=pool)
 
 
+@functools.lru_cache(maxsize=16)
 def get_queue(queue_name: str) -> Queue:
     """Get or create a named queue."""
-    global _queues
-    if queue_name not in _queues:
-        conn = get_redis_connection()
-        _queues[queue_name] = Queue(queue_name, connection=conn)
-    return _queues[queue_name]
+    return Queue(queue_name, connection=get_redis_connection())
 
 
 def create_envelope(
@@ -86,7 +88,7 @@ def create_envelope(
         "job_type": job_type,
         "source": source,
         "target": target,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": datetime.utcnow(),  # orjson writes the same ISO 8601 form as isoformat()
         "attempt": attempt,
         "reply_to": reply_to,
         "payload": payload,
@@ -138,8 +140,7 @@ def enqueue_ocr_request(
         # Use raw Redis LPUSH for cross-service queue (per PRD: "V1 can use Redis Lists")
         # OCR service will consume from this queue using its own worker
         conn = get_redis_connection()
-        envelope_json = json.dumps(envelope)
-        conn.lpush(QUEUE_OCR, envelope_json.encode('utf-8'))
+        conn.lpush(QUEUE_OCR, orjson.dumps(envelope, option=orjson.OPT_NON_STR_KEYS))
         
         logger.info("Enqueued OCR request %s (workflow %s) to %s", job_id, workflow_id, QUEUE_OCR)
     except Exception as exc:
@@ -182,7 +183,7 @@ def enqueue_recipes_job(
         queue = get_queue(QUEUE_RECIPES)
         queue.enqueue(
             "jarvis_recipes.app.services.queue_worker.process_job",
-            json.dumps(envelope),
+            orjson.dumps(envelope, option=orjson.OPT_NON_STR_KEYS).decode("utf-8"),
             job_id=job_id,
             job_timeout="10m",
         )
@@ -5,27 +5,100 @@ This module contains the actual job processing functions that are called
 by RQ workers. These functions handle the business logic for each job type.
 """
 import asyncio
+import atexit
 import json
 import logging
+import os
+import re
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
+import orjson
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from jarvis_recipes.app.core.config import get_settings
 from jarvis_recipes.app.db.session import SessionLocal
+from jarvis_recipes.app.schemas.ingestion import RecipeDraft
 from jarvis_recipes.app.schemas.ingestion_input import IngestionInput
 from jarvis_recipes.app.schemas.meal_plan import MealPlanGenerateRequest
 from jarvis_recipes.app.db import models
 from jarvis_recipes.app.services import mailbox_service, meal_plan_service, parse_job_service, url_recipe_parser
-from jarvis_recipes.app.services.image_ingest_worker import process_image_ingestion_job
 from jarvis_recipes.app.services.ingestion_service import parse_recipe as parse_recipe_ingestion
 from jarvis_recipes.app.services import ocr_quality
-from jarvis_recipes.app.services.llm_client import call_text_structuring, clean_and_validate_draft
+from jarvis_recipes.app.services.llm_client import aclose_llm_client, call_text_structuring, clean_and_validate_draft
+from jarvis_recipes.app.services.ocr_service_client import aclose_ocr_client
 from jarvis_recipes.app.services.queue_service import enqueue_job
+from jarvis_recipes.app.services.url_parsing.html_fetcher import aclose_fetch_client
 
 logger = logging.getLogger(__name__)
 
+# Whole-word unit tokens that suggest the LLM left the unit in the ingredient name
+_UNIT_IN_NAME_RE = re.compile(
+    r"\b(?:cups?|tsp|teaspoons?|tbsp|tablespoons?|oz|ounces?|lbs?|pounds?|g|grams?|kg|ml|liters?|cloves?)\b"
+)
+_COMBINED_RE = re.compile(r" and |,")
+
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_pid: Optional[int] = None
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop reused for every coroutine this worker process drives.
+
+    Created lazily and per-pid: RQ forks a work horse per job, and a loop (its
+    selector fd) must never be shared across a fork. Within one process the
+    loop, and the pooled LLM client bound to it, survive across calls.
+    """
+    global _worker_loop, _worker_loop_pid
+    pid = os.getpid()
+    if _worker_loop is None or _worker_loop.is_closed() or _worker_loop_pid != pid:
+        _worker_loop = asyncio.new_event_loop()
+        _worker_loop_pid = pid
+    return _worker_loop
+
+
+def _run(coro):
+    """Run a coroutine to completion on the worker loop."""
+    return _get_worker_loop().run_until_complete(coro)
+
+
+@atexit.register
+def _close_worker_loop() -> None:
+    loop = _worker_loop
+    if loop is None or loop.is_closed() or _worker_loop_pid != os.getpid():
+        return
+    try:
+        loop.run_until_complete(_aclose_http_clients())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+async def _aclose_http_clients() -> None:
+    """Close the pooled HTTP clients bound to the worker loop."""
+    await aclose_fetch_client()
+    await aclose_llm_client()
+    await aclose_ocr_client()
+
+
+def _worker_session() -> Session:
+    """
+    Session for job handlers. Attributes are not expired on commit: handlers only
+    commit values they just wrote, so reading them back must not cost a SELECT.
+    Status transitions in parse_job_service still expire the job themselves.
+    """
+    return SessionLocal(expire_on_commit=False)
+
+
+def _loads_envelope(payload_json: str) -> Any:
+    try:
+        return orjson.loads(payload_json)
+    except orjson.JSONDecodeError:
+        # orjson rejects NaN/Infinity, which Python producers' json.dumps emits by default
+        return json.loads(payload_json)
+
 
 def process_job(payload_json: str) -> None:
     """
@@ -43,7 +116,7 @@ def process_job(payload_json: str) -> None:
     db = None
     job_id = None
     try:
-        envelope = json.loads(payload_json)
+        envelope = _loads_envelope(payload_json)
         
         # Check if this is the new envelope format
         if "schema_version" in envelope and "job_type" in envelope:
@@ -56,7 +129,7 @@ def process_job(payload_json: str) -> None:
             
             logger.info("Processing job %s (%s) from envelope format", job_id, job_type)
             
-            db = SessionLocal()
+            db = _worker_session()
             try:
                 # For ocr.completed events, use workflow_id or parent_job_id to find the original job
                 # (job_id is a new UUID created by OCR service)
@@ -77,6 +150,8 @@ def process_job(payload_json: str) -> None:
                 if job.status == parse_job_service.RecipeParseJobStatus.CANCELED.value:
                     logger.info("Job %s was canceled, skipping", job_id)
                     return
+                # Read before mark_running expires the instance
+                job_pk = job.id
                 
                 # Mark as running
                 try:
@@ -88,17 +163,11 @@ def process_job(payload_json: str) -> None:
                 
                 # Route to appropriate handler based on job_type
                 try:
+                    handler = _ENVELOPE_HANDLERS.get(job_type)
                     if job_type == "ocr.completed":
-                        _process_ocr_completed(db, job, payload, parent_job_id)
-                    elif job_type == "recipe.import.url.requested":
-                        _process_url_job(db, job)
-                    elif job_type == "recipe.create.manual.requested":
-                        # Manual entry - not implemented yet
-                        parse_job_service.mark_error(db, job, "not_implemented", "Manual entry not yet implemented")
-                    elif job_type == "ingestion":
-                        _process_ingestion_job(db, job, payload)
-                    elif job_type == "meal_plan_generate":
-                        _process_meal_plan_job(db, job, payload)
+                        _handle_ocr_completed(db, job_pk, payload)
+                    elif handler is not None:
+                        handler(db, job, payload)
                     else:
                         logger.error("Unknown job type in envelope: %s", job_type)
                         parse_job_service.mark_error(db, job, "unknown_job_type", f"Unknown job type: {job_type}")
@@ -123,7 +192,7 @@ def process_job(payload_json: str) -> None:
             
             logger.info("Processing job %s (%s) from legacy format", job_id, job_type)
             
-            db = SessionLocal()
+            db = _worker_session()
             try:
                 if not job_id:
                     logger.error("Legacy job missing job_id in envelope")
@@ -146,16 +215,9 @@ def process_job(payload_json: str) -> None:
                 
                 # Route to legacy handlers
                 try:
-                    if job_type == "image":
-                        # Image jobs should now come via OCR completion, but handle legacy for migration
-                        logger.warning("Legacy image job detected - should use OCR queue")
-                        _process_image_job(db, job)
-                    elif job_type == "ingestion":
-                        _process_ingestion_job(db, job, job_data)
-                    elif job_type == "meal_plan_generate":
-                        _process_meal_plan_job(db, job, job_data)
-                    elif job_type == "url":
-                        _process_url_job(db, job)
+                    handler = _LEGACY_HANDLERS.get(job_type)
+                    if handler is not None:
+                        handler(db, job, job_data)
                     else:
                         logger.error("Unknown job type: %s", job_type)
                         parse_job_service.mark_error(db, job, "unknown_job_type", f"Unknown job type: {job_type}")
@@ -181,7 +243,7 @@ def process_job(payload_json: str) -> None:
         # Try to mark job as error if we have a job_id
         if job_id:
             try:
-                db = SessionLocal()
+                db = _worker_session()
                 try:
                     job = db.get(models.RecipeParseJob, job_id)
                     if job:
@@ -198,7 +260,73 @@ def process_job(payload_json: str) -> None:
                 logger.exception("Failed to create database session to mark job %s as error: %s", job_id, db_exc)
 
 
-def _process_ocr_completed(db: Session, job: Any, payload: Dict[str, Any], parent_job_id: Optional[str]) -> None:
+def _needs_cleaning(draft: RecipeDraft, job_id: str) -> bool:
+    """
+    Decide whether a structured draft should go through the LLM cleanup pass:
+    it fails validation, or shows issues rule-based cleanup tends to miss
+    (units in ingredient names, combined ingredients, missing description).
+    """
+    try:
+        draft.validate_minimums()
+    except Exception as validation_exc:
+        logger.warning("Initial draft validation failed for job %s: %s", job_id, validation_exc)
+        logger.info("Draft validation failed, will attempt cleanup for job %s", job_id)
+        return True
+
+    if not draft.description:
+        # Missing description - will be added during cleanup
+        logger.info("Missing description, will add during cleanup for job %s", job_id)
+        return True
+    for ing in draft.ingredients:
+        name_lower = ing.name.lower() if ing.name else ""
+        if not ing.unit and _UNIT_IN_NAME_RE.search(name_lower):
+            logger.info("Detected unit in ingredient name, will cleanup for job %s", job_id)
+            return True
+        # Check for combined ingredients (and, comma-separated)
+        if _COMBINED_RE.search(name_lower):
+            logger.info("Detected combined ingredients, will cleanup for job %s", job_id)
+            return True
+    return False
+
+
+async def _structure_then_maybe_clean(
+    job_id: str,
+    text: str,
+    model_name: str,
+    canceled: Callable[[], bool],
+) -> Tuple[Optional[RecipeDraft], bool, bool]:
+    """
+    Structure OCR text into a draft and, if it needs it, clean it in the same loop run.
+
+    Returns ``(draft, cleanup_ran, aborted)``. ``cleanup_ran`` is False when the draft
+    already passed validation and the heuristics, so it needs no re-validation;
+    ``aborted`` is True when ``canceled()`` reported a cancel before the cleanup
+    call. A failed cleanup keeps the original draft.
+    """
+    draft = await call_text_structuring(text, model_name)
+    logger.info("LLM text structuring completed for job %s: draft=%s", job_id, "present" if draft else "None")
+    if not draft or not _needs_cleaning(draft, job_id):
+        return draft, False, False
+
+    if canceled():
+        return draft, False, True
+
+    logger.info("Cleaning and validating draft for job %s with lightweight model", job_id)
+    try:
+        draft = await clean_and_validate_draft(draft, model_name)
+        logger.info("Draft cleaning completed for job %s", job_id)
+    except Exception as cleanup_exc:
+        logger.warning("Draft cleaning failed for job %s: %s, using original draft", job_id, cleanup_exc)
+        # Continue with original draft
+    return draft, True, False
+
+
+def _process_ocr_completed(
+    db: Session,
+    job: Any,
+    payload: Dict[str, Any],
+    ingestion: Optional[models.RecipeIngestion] = None,
+) -> None:
     """
     Process an OCR completion event from the OCR service.
     
@@ -206,6 +334,7 @@ def _process_ocr_completed(db: Session, job: Any, payload: Dict[str, Any], paren
     extraction pipeline (quality check, text structuring, draft creation).
     
     The payload contains a `results[]` array with one entry per image, aligned by index.
+    `ingestion` may be passed in when the caller already loaded it alongside the job.
     
     All exceptions are caught and handled gracefully to prevent worker crashes.
     """
@@ -235,79 +364,79 @@ def _process_ocr_completed(db: Session, job: Any, payload: Dict[str, Any], paren
             parse_job_service.mark_error(db, job, "ocr_no_results", "OCR service returned no results")
             return
         
-        # Sort results by index to preserve image order
+        # Sort results by index to preserve image order (the OCR service normally
+        # emits them in order already, which Timsort handles in one linear pass)
         sorted_results = sorted(results, key=lambda r: r.get("index", 0))
         
-        # Check for per-image errors and collect successful results
-        successful_results = []
-        failed_results = []
+        # One pass over the results: split failures from successes and, for the
+        # successes, collect text, confidence totals and the first tier
+        per_image_errors = []
+        ocr_texts = []
+        successful_count = 0
+        confidence_sum = 0.0
+        confidence_count = 0
+        tier = None
         for result in sorted_results:
             result_error = result.get("error")
             if result_error and result_error.get("code"):
                 # Per-image failure
-                failed_results.append({
-                    "index": result.get("index", -1),
-                    "error": result_error,
+                index = result.get("index", -1)
+                per_image_errors.append({
+                    "index": index,
+                    "code": result_error.get("code"),
+                    "message": result_error.get("message"),
                 })
                 logger.warning(
                     "OCR failed for image index %d in job %s: %s (%s)",
-                    result.get("index", -1),
+                    index,
                     job.id,
                     result_error.get("message", "Unknown error"),
                     result_error.get("code", "unknown"),
                 )
-            else:
-                # Success (error is null or empty)
-                successful_results.append(result)
+                continue
+            # Success (error is null or empty)
+            successful_count += 1
+            ocr_text = result.get("ocr_text", "")
+            if ocr_text:
+                ocr_texts.append(ocr_text)
+            meta = result.get("meta") or {}
+            confidence = meta.get("confidence")
+            if confidence is not None:
+                confidence_sum += confidence
+                confidence_count += 1
+            if tier is None:
+                # Use first successful result's tier for logging
+                tier = meta.get("tier", "unknown")
         
         # If all images failed, mark job as failed
-        if not successful_results:
-            error_messages = [f"Image {r['index']}: {r['error'].get('message', 'Unknown error')}" for r in failed_results]
-            error_code = failed_results[0]["error"].get("code", "ocr_all_images_failed") if failed_results else "ocr_all_images_failed"
+        if not successful_count:
+            error_messages = [f"Image {r['index']}: {r['message'] or 'Unknown error'}" for r in per_image_errors]
+            error_code = per_image_errors[0]["code"] if per_image_errors else "ocr_all_images_failed"
             error_message = f"All images failed OCR: {'; '.join(error_messages)}"
             parse_job_service.mark_error(db, job, error_code, error_message)
             return
         
         # Log partial failures if any
-        if failed_results:
+        if per_image_errors:
             logger.warning(
                 "Partial OCR failure for job %s: %d/%d images succeeded",
                 job.id,
-                len(successful_results),
+                successful_count,
                 len(results),
             )
         
-        # Combine OCR text from successful images only (preserving order)
-        ocr_texts = []
-        all_metas = []
-        for result in successful_results:
-            ocr_text = result.get("ocr_text", "")
-            if ocr_text:
-                ocr_texts.append(ocr_text)
-            all_metas.append(result.get("meta", {}))
-        
-        # Check if job was canceled before continuing
-        db.refresh(job)
-        if parse_job_service.is_canceled(job):
-            logger.info("Job %s was canceled during OCR processing, aborting", job.id)
-            return
-        
         # Combine all OCR text with double newline separator
         combined_text = "\n\n".join(ocr_texts)
         
         if not combined_text:
             error_message = "No OCR text extracted from any successful image"
-            if failed_results:
-                error_message += f" ({len(failed_results)} image(s) failed)"
+            if per_image_errors:
+                error_message += f" ({len(per_image_errors)} image(s) failed)"
             parse_job_service.mark_error(db, job, "ocr_no_text", error_message)
             return
         
-        # Calculate mean confidence across successful images only
-        confidences = [meta.get("confidence", 0.0) for meta in all_metas if meta.get("confidence") is not None]
-        mean_confidence = sum(confidences) / len(confidences) if confidences else None
-        
-        # Get provider/tier info (use first successful result's tier for logging)
-        tier = all_metas[0].get("tier", "unknown") if all_metas else "unknown"
+        # Mean confidence across successful images only
+        mean_confidence = confidence_sum / confidence_count if confidence_count else None
         
         # Get ingestion from job data
         job_data = job.job_data or {}
@@ -318,18 +447,24 @@ def _process_ocr_completed(db: Session, job: Any, payload: Dict[str, Any], paren
             parse_job_service.mark_error(db, job, "invalid_job_data", "Missing ingestion_id in job data")
             return
         
-        logger.info("Looking up ingestion %s for job %s", ingestion_id, job.id)
-        ingestion = db.get(models.RecipeIngestion, ingestion_id)
+        if ingestion is None or ingestion.id != ingestion_id:
+            logger.info("Looking up ingestion %s for job %s", ingestion_id, job.id)
+            ingestion = db.get(models.RecipeIngestion, ingestion_id)
         if not ingestion:
             logger.error("Ingestion %s not found for job %s", ingestion_id, job.id)
             parse_job_service.mark_error(db, job, "invalid_ingestion", "Ingestion not found")
             return
         logger.info("Found ingestion %s for job %s", ingestion_id, job.id)
         
-        ingestion.status = "RUNNING"
         try:
+            # Single-column flip: a Core UPDATE, with the loaded object synced in place
+            db.execute(
+                update(models.RecipeIngestion)
+                .where(models.RecipeIngestion.id == ingestion.id)
+                .values(status="RUNNING")
+                .execution_options(synchronize_session="evaluate")
+            )
             db.commit()
-            db.refresh(ingestion)
         except Exception as commit_exc:
             logger.exception("Failed to commit ingestion status update for job %s: %s", job.id, commit_exc)
             db.rollback()
@@ -362,76 +497,35 @@ def _process_ocr_completed(db: Session, job: Any, payload: Dict[str, Any], paren
             return
         
         # Check if job was canceled before LLM call
-        db.refresh(job)
-        if parse_job_service.is_canceled(job):
+        if parse_job_service.is_job_canceled(db, job.id):
             logger.info("Job %s was canceled before LLM call, aborting", job.id)
             return
         
         # Text structuring (LLM call to extract recipe from combined OCR text)
         settings = get_settings()
         tier_max = job_data.get("tier_max") or ingestion.tier_max or 3
-        
+
         logger.info("Calling LLM text structuring for job %s with model %s (text_length=%d)", 
                    job.id, settings.llm_lightweight_model_name, len(combined_text))
         try:
-            draft = asyncio.run(call_text_structuring(combined_text, settings.llm_lightweight_model_name))
-            logger.info("LLM text structuring completed for job %s: draft=%s", job.id, "present" if draft else "None")
-            
+            draft, cleanup_ran, aborted = _run(
+                _structure_then_maybe_clean(
+                    job.id,
+                    combined_text,
+                    settings.llm_lightweight_model_name,
+                    lambda: parse_job_service.is_job_canceled(db, job.id),
+                )
+            )
+            if aborted:
+                logger.info("Job %s was canceled before draft cleaning, aborting", job.id)
+                return
+
             if draft:
-                # Validate draft minimums first
-                validation_passed = False
-                validation_error = None
-                try:
-                    draft.validate_minimums()
-                    validation_passed = True
-                except Exception as validation_exc:
-                    validation_error = str(validation_exc)
-                    logger.warning("Initial draft validation failed for job %s: %s", job.id, validation_error)
-                
-                # Conditionally clean and validate draft using lightweight model if validation failed
-                # or if we detect common issues (units in ingredient names, combined ingredients, missing description)
-                needs_cleaning = False
-                if not validation_passed:
-                    needs_cleaning = True
-                    logger.info("Draft validation failed, will attempt cleanup for job %s", job.id)
-                else:
-                    # Check for common issues that rule-based cleanup might miss
-                    for ing in draft.ingredients:
-                        # Check if unit might be in name (common units in name)
-                        name_lower = ing.name.lower() if ing.name else ""
-                        common_units = ["cup", "cups", "tsp", "teaspoon", "tbsp", "tablespoon", "oz", "ounce", "lb", "pound", "g", "gram", "kg", "ml", "liter", "clove", "cloves"]
-                        if any(unit in name_lower for unit in common_units) and not ing.unit:
-                            needs_cleaning = True
-                            logger.info("Detected unit in ingredient name, will cleanup for job %s", job.id)
-                            break
-                        # Check for combined ingredients (and, comma-separated)
-                        if " and " in name_lower or ("," in name_lower and len(name_lower.split(",")) > 1):
-                            needs_cleaning = True
-                            logger.info("Detected combined ingredients, will cleanup for job %s", job.id)
-                            break
-                    if not draft.description:
-                        # Missing description - will be added during cleanup
-                        needs_cleaning = True
-                        logger.info("Missing description, will add during cleanup for job %s", job.id)
-                
-                if needs_cleaning:
-                    # Check if job was canceled before cleaning
-                    db.refresh(job)
-                    if parse_job_service.is_canceled(job):
-                        logger.info("Job %s was canceled before draft cleaning, aborting", job.id)
-                        return
-                    
-                    logger.info("Cleaning and validating draft for job %s with lightweight model", job.id)
-                    try:
-                        draft = asyncio.run(clean_and_validate_draft(draft, settings.llm_lightweight_model_name))
-                        logger.info("Draft cleaning completed for job %s", job.id)
-                    except Exception as cleanup_exc:
-                        logger.warning("Draft cleaning failed for job %s: %s, using original draft", job.id, cleanup_exc)
-                        # Continue with original draft
-                
-                # Validate draft minimums again (after cleanup if it was done)
+                # Validate draft minimums again if cleanup ran; otherwise the draft
+                # already passed them in _needs_cleaning and is unchanged
                 try:
-                    draft.validate_minimums()
+                    if cleanup_ran:
+                        draft.validate_minimums()
                 except Exception as validation_exc:
                     logger.warning("Draft validation failed for job %s: %s", job.id, validation_exc)
                     parse_job_service.mark_error(db, job, "draft_validation_failed", str(validation_exc))
@@ -456,24 +550,23 @@ def _process_ocr_completed(db: Session, job: Any, payload: Dict[str, Any], paren
                         "metrics": quality_result,
                         "provider": tier,  # Use tier from first successful result
                         "image_count": len(results),
-                        "successful_images": len(successful_results),
-                        "failed_images": len(failed_results),
-                        "per_image_errors": [
-                            {"index": r["index"], "code": r["error"].get("code"), "message": r["error"].get("message")}
-                            for r in failed_results
-                        ] if failed_results else None,
+                        "successful_images": successful_count,
+                        "failed_images": len(per_image_errors),
+                        "per_image_errors": per_image_errors or None,
                     }],
                     "selected_tier": 1,
                 }
                 try:
                     db.commit()
-                    db.refresh(ingestion)
                 except Exception as commit_exc:
                     logger.exception("Failed to commit ingestion success for job %s: %s", job.id, commit_exc)
                     db.rollback()
                     parse_job_service.mark_error(db, job, "database_error", f"Failed to save ingestion result: {commit_exc}")
                     return
                 
+                # Dumped once; the mailbox payload and result_json share it
+                draft_dump = draft.model_dump()
+
                 # Publish completion message (non-critical - log but don't fail job if this fails)
                 try:
                     mailbox_service.publish(
@@ -482,7 +575,7 @@ def _process_ocr_completed(db: Session, job: Any, payload: Dict[str, Any], paren
                         "recipe_image_ingestion_completed",
                         {
                             "ingestion_id": ingestion.id,
-                            "recipe_draft": draft.model_dump(),
+                            "recipe_draft": draft_dump,
                             "pipeline": ingestion.pipeline_json,
                         },
                     )
@@ -494,12 +587,11 @@ def _process_ocr_completed(db: Session, job: Any, payload: Dict[str, Any], paren
                 try:
                     # Store the draft in result_json (ParseResult expects ParsedRecipe, but we have RecipeDraft)
                     job.result_json = {
-                        "recipe_draft": draft.model_dump(),
+                        "recipe_draft": draft_dump,
                         "pipeline": ingestion.pipeline_json,
                     }
                     job.status = parse_job_service.RecipeParseJobStatus.COMPLETE.value
                     db.commit()
-                    db.refresh(job)
                     logger.info("OCR completion processed successfully for job %s", job.id)
                 except Exception as commit_exc:
                     logger.exception("Failed to mark job %s as complete: %s", job.id, commit_exc)
@@ -555,10 +647,13 @@ def _process_image_job(db: Session, job: Any) -> None:
     for backwards compatibility during migration.
     All exceptions are caught and handled gracefully.
     """
+    # Imported here: it pulls in the S3 client stack, which no other job type needs
+    from jarvis_recipes.app.services.image_ingest_worker import process_image_ingestion_job
+
     try:
         logger.warning("Legacy image job handler called for job %s - should use OCR queue", job.id)
         logger.debug("Starting image job processing for job %s", job.id)
-        asyncio.run(process_image_ingestion_job(db, job))
+        _run(process_image_ingestion_job(db, job))
         logger.debug("Completed image job processing for job %s", job.id)
     except Exception as exc:
         logger.exception("Image job %s crashed with exception: %s", job.id, exc)
@@ -591,7 +686,7 @@ def _process_ingestion_job(db: Session, job: Any, job_data: Dict[str, Any]) -> N
         return
     
     try:
-        result = asyncio.run(parse_recipe_ingestion(input_payload))
+        result = _run(parse_recipe_ingestion(input_payload))
         if result.success:
             try:
                 parse_job_service.mark_complete(db, job, result)
@@ -619,7 +714,6 @@ def _process_ingestion_job(db: Session, job: Any, job_data: Dict[str, Any]) -> N
                     job.error_code = result.error_code
                     job.error_message = result.error_message
                     db.commit()
-                    db.refresh(job)
                     # Re-enqueue to Redis
                     enqueue_job(job.job_type, job.id, job.job_data or {})
                 except Exception as retry_exc:
@@ -674,7 +768,8 @@ def _process_meal_plan_job(db: Session, job: Any, job_data: Dict[str, Any]) -> N
     try:
         result, slot_failures = meal_plan_service.generate_meal_plan(db, job.user_id, req, request_id)
         try:
-            meal_plan_service.publish_completed(db, job.user_id, request_id, result, slot_failures)
+            # Committed together with the job completion below
+            meal_plan_service.publish_completed(db, job.user_id, request_id, result, slot_failures, commit=False)
         except Exception as publish_exc:
             logger.warning("Failed to publish meal plan completion for job %s: %s", job.id, publish_exc)
             # Continue - job completion is more important than messaging
@@ -683,7 +778,6 @@ def _process_meal_plan_job(db: Session, job: Any, job_data: Dict[str, Any]) -> N
             job.result_json = {"result": result.model_dump(mode="json"), "slot_failures_count": slot_failures}
             job.status = parse_job_service.RecipeParseJobStatus.COMPLETE.value
             db.commit()
-            db.refresh(job)
         except Exception as commit_exc:
             logger.exception("Failed to mark meal plan job %s as complete: %s", job.id, commit_exc)
             db.rollback()
@@ -708,7 +802,7 @@ def _process_url_job(db: Session, job: Any) -> None:
     max_retries = settings.llm_recipe_queue_max_retries
     
     try:
-        result = asyncio.run(url_recipe_parser.parse_recipe_from_url(job.url, job.use_llm_fallback))
+        result = _run(url_recipe_parser.parse_recipe_from_url(job.url, job.use_llm_fallback))
         if result.success:
             try:
                 parse_job_service.mark_complete(db, job, result)
@@ -726,7 +820,6 @@ def _process_url_job(db: Session, job: Any) -> None:
                     job.error_code = result.error_code
                     job.error_message = result.error_message
                     db.commit()
-                    db.refresh(job)
                     # Re-enqueue to Redis
                     enqueue_job(job.job_type, job.id, job.job_data or {})
                 except Exception as retry_exc:
@@ -748,3 +841,43 @@ def _process_url_job(db: Session, job: Any) -> None:
         except Exception as mark_exc:
             logger.exception("Failed to mark job %s as error after crash: %s", job.id, mark_exc)
 
+
+def _handle_ocr_completed(db: Session, job_id: str, payload: Dict[str, Any]) -> None:
+    # mark_running expired the job; reload it together with its ingestion in one query
+    job, ingestion = parse_job_service.load_job_with_ingestion(db, job_id)
+    if job is None:
+        logger.error("Job %s disappeared before OCR completion could be processed", job_id)
+        return
+    _process_ocr_completed(db, job, payload, ingestion=ingestion)
+
+
+def _handle_manual_entry(db: Session, job: Any, payload: Dict[str, Any]) -> None:
+    # Manual entry - not implemented yet
+    parse_job_service.mark_error(db, job, "not_implemented", "Manual entry not yet implemented")
+
+
+def _handle_legacy_image(db: Session, job: Any, job_data: Dict[str, Any]) -> None:
+    # Image jobs should now come via OCR completion, but handle legacy for migration
+    logger.warning("Legacy image job detected - should use OCR queue")
+    _process_image_job(db, job)
+
+
+def _handle_url(db: Session, job: Any, payload: Dict[str, Any]) -> None:
+    _process_url_job(db, job)
+
+
+# job_type -> handler(db, job, payload)
+# ("ocr.completed" is dispatched by job id, see _handle_ocr_completed)
+_ENVELOPE_HANDLERS: Dict[str, Callable[[Session, Any, Dict[str, Any]], None]] = {
+    "recipe.import.url.requested": _handle_url,
+    "recipe.create.manual.requested": _handle_manual_entry,
+    "ingestion": _process_ingestion_job,
+    "meal_plan_generate": _process_meal_plan_job,
+}
+
+_LEGACY_HANDLERS: Dict[str, Callable[[Session, Any, Dict[str, Any]], None]] = {
+    "image": _handle_legacy_image,
+    "ingestion": _process_ingestion_job,
+    "meal_plan_generate": _process_meal_plan_job,
+    "url": _handle_url,
+}
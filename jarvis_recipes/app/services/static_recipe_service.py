@@ -1,7 +1,8 @@
 import json
+from collections import defaultdict
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -17,6 +18,18 @@ def _load_stock_recipes(base_path: Path) -> List[Dict[str, Any]]:
         return json.load(f)
 
 
+@lru_cache(maxsize=1)
+def stock_recipe_index(base_path: Path) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, FrozenSet[int]]]:
+    """Index stock recipes by id, and each tag to the positions of the recipes carrying it."""
+    by_id: Dict[str, Dict[str, Any]] = {}
+    tag_positions: Dict[str, Set[int]] = defaultdict(set)
+    for pos, recipe in enumerate(_load_stock_recipes(base_path)):
+        by_id.setdefault(recipe.get("id"), recipe)
+        for tag in recipe.get("tags") or []:
+            tag_positions[tag].add(pos)
+    return by_id, {tag: frozenset(positions) for tag, positions in tag_positions.items()}
+
+
 def list_stock_recipes(base_path: Path, q: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
     data = _load_stock_recipes(base_path)
     if q:
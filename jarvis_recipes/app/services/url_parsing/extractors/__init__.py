@@ -2,14 +2,18 @@
 
 from jarvis_recipes.app.services.url_parsing.extractors.heuristic import (
     extract_recipe_heuristic,
+    extract_recipe_heuristic_soup,
 )
 from jarvis_recipes.app.services.url_parsing.extractors.llm import extract_recipe_via_llm
 from jarvis_recipes.app.services.url_parsing.extractors.schema_org import (
     extract_recipe_from_schema_org,
+    extract_recipe_from_schema_org_soup,
 )
 
 __all__ = [
     "extract_recipe_from_schema_org",
+    "extract_recipe_from_schema_org_soup",
     "extract_recipe_heuristic",
+    "extract_recipe_heuristic_soup",
     "extract_recipe_via_llm",
 ]
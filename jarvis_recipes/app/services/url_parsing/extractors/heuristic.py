@@ -141,7 +141,14 @@ def _find_instruction_items(container) -> List[str]:
 
 def extract_recipe_heuristic(html: str, url: str) -> Optional[ParsedRecipe]:
     """Extract recipe using heuristic HTML analysis."""
-    soup = BeautifulSoup(html, "lxml")
+    return extract_recipe_heuristic_soup(BeautifulSoup(html, "lxml"), url)
+
+
+def extract_recipe_heuristic_soup(soup: BeautifulSoup, url: str) -> Optional[ParsedRecipe]:
+    """Extract recipe using heuristic analysis of an already-parsed document.
+
+    The soup is only read, so callers may reuse it for other extractors.
+    """
     title_tag = soup.find("h1") or soup.title
     title = clean_text(title_tag.get_text()) if title_tag else None
 
@@ -22,7 +22,14 @@ logger = logging.getLogger(__name__)
 
 def extract_recipe_from_schema_org(html: str, url: str) -> Optional[ParsedRecipe]:
     """Extract recipe from schema.org JSON-LD data embedded in HTML."""
-    soup = BeautifulSoup(html, "lxml")
+    return extract_recipe_from_schema_org_soup(BeautifulSoup(html, "lxml"), url)
+
+
+def extract_recipe_from_schema_org_soup(soup: BeautifulSoup, url: str) -> Optional[ParsedRecipe]:
+    """Extract recipe from schema.org JSON-LD data in an already-parsed document.
+
+    The soup is only read, so callers may reuse it for other extractors.
+    """
     scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
     logger.info("Found %d JSON-LD script blocks", len(scripts))
 
@@ -16,6 +16,7 @@ import logging
 import os
 import re
 import socket
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -33,6 +34,41 @@ _REDIRECT_CODES = {301, 302, 303, 307, 308}
 # Request headers that must not be replayed to a different origin on redirect.
 _SENSITIVE_HEADERS = {"authorization", "cookie", "proxy-authorization"}
 
+_FETCH_TIMEOUT = httpx.Timeout(15.0, read=15.0, connect=5.0)
+_FETCH_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+# Shared client for fetch_html, bound to the event loop that created it (pooled
+# connections can't cross loops, e.g. workers that asyncio.run() per job).
+_fetch_client: Optional[httpx.AsyncClient] = None
+_fetch_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_fetch_client() -> httpx.AsyncClient:
+    """Return the pooled fetch client, reusing TCP/TLS connections across calls.
+
+    The client never stores cookies (Set-Cookie from one user's fetch must not
+    be replayed on another's); per-request Cookie headers still apply.
+    """
+    global _fetch_client, _fetch_client_loop
+    loop = asyncio.get_running_loop()
+    if _fetch_client is None or _fetch_client.is_closed or _fetch_client_loop is not loop:
+        _fetch_client = httpx.AsyncClient(
+            timeout=_FETCH_TIMEOUT,
+            follow_redirects=False,
+            limits=_FETCH_LIMITS,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        _fetch_client_loop = loop
+    return _fetch_client
+
+
+async def aclose_fetch_client() -> None:
+    """Close the shared fetch client (application shutdown)."""
+    global _fetch_client, _fetch_client_loop
+    if _fetch_client is not None and _fetch_client_loop is asyncio.get_running_loop():
+        await _fetch_client.aclose()
+    _fetch_client = None
+    _fetch_client_loop = None
+
 
 def _ip_blocked(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
     """True if ``ip`` is unsafe for outbound fetching (SSRF guard).
@@ -131,10 +167,15 @@ async def _request_following_redirects(
     Sensitive headers/cookies are dropped on cross-origin hops. The client must
     be created with ``follow_redirects=False``. Raises ``ValueError`` on a
     blocked/invalid hop or when ``max_redirects`` is exceeded.
+
+    The shared client stores no cookies, so ``Set-Cookie`` from earlier hops is
+    collected here, per call, and replayed on same-origin hops (consent/bot
+    cookies set mid-redirect would otherwise loop until "Too many redirects").
     """
     current = url
     current_headers = dict(headers)
     current_cookies = cookies
+    collected = httpx.Cookies()
     for _ in range(max_redirects + 1):
         parsed = urlparse(current)
         if parsed.scheme not in {"http", "https"} or not parsed.hostname:
@@ -143,8 +184,11 @@ async def _request_following_redirects(
             raise ValueError("URL points to a private or disallowed host")
         # Dispatch by method name (client.head / client.get) rather than
         # client.request so existing call sites and test mocks keep working.
+        hop_cookies = current_cookies
+        if len(collected.jar):
+            hop_cookies = {**(current_cookies or {}), **{c.name: c.value for c in collected.jar}}
         resp = await getattr(client, method.lower())(
-            current, headers=current_headers, cookies=current_cookies
+            current, headers=current_headers, cookies=hop_cookies
         )
         if resp.status_code in _REDIRECT_CODES and "location" in resp.headers:
             next_url = str(httpx.URL(current).join(resp.headers["location"]))
@@ -155,6 +199,9 @@ async def _request_following_redirects(
                     if k.lower() not in _SENSITIVE_HEADERS
                 }
                 current_cookies = None
+                collected = httpx.Cookies()
+            elif "set-cookie" in resp.headers:
+                collected.extract_cookies(resp)
             current = next_url
             continue
         return resp
@@ -350,19 +397,15 @@ async def fetch_html(url: str) -> str:
     cookie_env = os.getenv("SCRAPER_COOKIES")
     if cookie_env:
         headers["Cookie"] = cookie_env
-    timeout = httpx.Timeout(15.0, read=15.0, connect=5.0)
 
     async def _try_fetch(
         target_url: str, extra_headers: Optional[dict] = None
     ) -> httpx.Response:
         merged_headers = headers | (extra_headers or {})
         # follow_redirects=False + manual walk so each 3xx hop is re-validated.
-        async with httpx.AsyncClient(
-            timeout=timeout, follow_redirects=False
-        ) as client:
-            return await _request_following_redirects(
-                client, "GET", target_url, headers=merged_headers
-            )
+        return await _request_following_redirects(
+            _get_fetch_client(), "GET", target_url, headers=merged_headers
+        )
 
     try:
         response = await _try_fetch(url)
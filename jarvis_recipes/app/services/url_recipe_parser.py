@@ -36,10 +36,12 @@ from jarvis_recipes.app.services.url_parsing.parsing_utils import (
 )
 from jarvis_recipes.app.services.url_parsing.extractors.schema_org import (
     extract_recipe_from_schema_org,
+    extract_recipe_from_schema_org_soup,
 )
 from jarvis_recipes.app.services.url_parsing.extractors.heuristic import (
     clean_soup_for_content,
     extract_recipe_heuristic,
+    extract_recipe_heuristic_soup,
     find_main_node,
 )
 from jarvis_recipes.app.services.url_parsing.extractors.llm import (
@@ -62,8 +64,10 @@ __all__ = [
     "fetch_html",
     # Extractors
     "extract_recipe_from_schema_org",
+    "extract_recipe_from_schema_org_soup",
     "extract_recipe_from_microdata",
     "extract_recipe_heuristic",
+    "extract_recipe_heuristic_soup",
     "extract_recipe_via_llm",
     # HTML utilities (used by ingestion_service)
     "clean_soup_for_content",
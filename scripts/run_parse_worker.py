@@ -20,6 +20,9 @@ from jarvis_recipes.app.schemas.meal_plan import MealPlanGenerateRequest
 from jarvis_recipes.app.schemas.ingestion_input import IngestionInput
 from jarvis_recipes.app.services.ingestion_service import parse_recipe as parse_recipe_ingestion
 from jarvis_recipes.app.services.image_ingest_worker import process_image_ingestion_job
+from jarvis_recipes.app.services.llm_client import aclose_llm_client
+from jarvis_recipes.app.services.ocr_service_client import aclose_ocr_client
+from jarvis_recipes.app.services.url_parsing.html_fetcher import aclose_fetch_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("parse_worker")
@@ -27,23 +30,36 @@ logger = logging.getLogger("parse_worker")
 POLL_INTERVAL_SECONDS = 5
 
 
+def _run(coro):
+    """asyncio.run the coroutine, closing the pooled HTTP clients before its loop is closed."""
+
+    async def _wrapped():
+        try:
+            return await coro
+        finally:
+            await aclose_fetch_client()
+            await aclose_llm_client()
+            await aclose_ocr_client()
+
+    return asyncio.run(_wrapped())
+
+
 def process_one(db: Session) -> bool:
     settings = get_settings()
     max_retries = settings.llm_recipe_queue_max_retries
     job = (
-        parse_job_service.fetch_next_pending(db, job_type="ingestion")
-        or parse_job_service.fetch_next_pending(db, job_type="image")
-        or parse_job_service.fetch_next_pending(db, job_type="meal_plan_generate")
-        or parse_job_service.fetch_next_pending(db, job_type="url")
+        parse_job_service.claim_next_pending(db, job_type="ingestion")
+        or parse_job_service.claim_next_pending(db, job_type="image")
+        or parse_job_service.claim_next_pending(db, job_type="meal_plan_generate")
+        or parse_job_service.claim_next_pending(db, job_type="url")
     )
     if not job:
         return False
     logger.info("Processing job %s (%s)", job.id, job.job_type)
-    parse_job_service.mark_running(db, job)
 
     if job.job_type == "image":
         try:
-            asyncio.run(process_image_ingestion_job(db, job))
+            _run(process_image_ingestion_job(db, job))
             return True
         except Exception as exc:  # noqa: BLE001
             logger.exception("Image job %s crashed", job.id)
@@ -57,7 +73,7 @@ def process_one(db: Session) -> bool:
             parse_job_service.mark_error(db, job, "invalid_payload", str(exc))
             return True
         try:
-            result = asyncio.run(parse_recipe_ingestion(input_payload))
+            result = _run(parse_recipe_ingestion(input_payload))
             if result.success:
                 parse_job_service.mark_complete(db, job, result)
                 logger.info("Job %s complete", job.id)
@@ -122,7 +138,7 @@ def process_one(db: Session) -> bool:
         return True
 
     try:
-        result = asyncio.run(url_recipe_parser.parse_recipe_from_url(job.url, job.use_llm_fallback))
+        result = _run(url_recipe_parser.parse_recipe_from_url(job.url, job.use_llm_fallback))
         if result.success:
             parse_job_service.mark_complete(db, job, result)
             logger.info("Job %s complete", job.id)
@@ -127,3 +127,25 @@ async def test_walk_too_many_redirects() -> None:
         await h._request_following_redirects(
             client, "GET", _PUBLIC, headers={"User-Agent": "x"}, max_redirects=1
         )
+
+
+async def test_walk_replays_cookie_set_during_same_origin_redirect() -> None:
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("cookie"))
+        if request.url.path == "/":
+            return httpx.Response(302, headers={"location": "/recipe", "set-cookie": "consent=1; Path=/"})
+        if request.url.path == "/recipe":
+            return httpx.Response(302, headers={"location": "http://1.1.1.1/elsewhere"})
+        return _ok()
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        follow_redirects=False,
+        cookies=h.CookieJar(policy=h.DefaultCookiePolicy(allowed_domains=[])),
+    ) as client:
+        resp = await h._request_following_redirects(client, "GET", _PUBLIC, headers={"User-Agent": "x"})
+
+    assert resp.status_code == 200
+    assert seen == [None, "consent=1", None]
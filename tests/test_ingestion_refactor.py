@@ -62,3 +62,22 @@ async def test_blocked_url_sets_next_action(monkeypatch):
     assert result.next_action == "webview_extract"
     assert result.next_action_reason == "blocked_by_site"
 
+
+
+@pytest.mark.asyncio
+async def test_non_recipe_jsonld_blocks_are_skipped():
+    payload = json.loads(Path("tests/fixtures/ingestion/jsonld_valid.json").read_text())
+    noise = [json.dumps({"@type": "BreadcrumbList"}), json.dumps({"@type": "Organization", "name": "Site"})]
+    input_obj = IngestionInput(source_type="client_webview", jsonld_blocks=noise + payload["jsonld_blocks"])
+    result = await parse_recipe(input_obj)
+    assert result.success
+    assert result.parser_strategy == "client_json_ld"
+
+
+@pytest.mark.asyncio
+async def test_multibyte_html_snippet_measured_in_bytes():
+    # 250k chars but 500KB of UTF-8: over the byte limit even though the char count is not
+    input_obj = IngestionInput(source_type="client_webview", html_snippet="é" * 250_000)
+    result = await parse_recipe(input_obj)
+    assert not result.success
+    assert result.error_message == "html_snippet_too_large"
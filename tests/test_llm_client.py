@@ -0,0 +1,61 @@
+import pytest
+
+from jarvis_recipes.app.services.llm_client import (
+    _coerce_recipe_draft,
+    _strip_code_fence,
+    _try_local_json_repair,
+)
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ('{"a": 1}', '{"a": 1}'),
+        ('```json\n{"a": 1}\n```', '{"a": 1}'),
+        ('  ```\n{"a": 1}```  ', '{"a": 1}'),
+        ('{"a": 1}\n```', '{"a": 1}'),
+        ("```json```", ""),
+    ],
+)
+def test_strip_code_fence(text, expected):
+    assert _strip_code_fence(text) == expected
+
+
+def test_coerce_recipe_draft_normalizes_ingredients():
+    raw = {
+        "recipe": {
+            "name": "Simple Pie",
+            "ingredients": [
+                {"label": "2 cups flour"},
+                {"name": "sugar", "quantity": "1 cup sugar"},
+                {"name": "eggs", "quantity": {"value": 3}},
+                {"name": "", "quantity": "1"},
+                "not an ingredient",
+            ],
+            "directions": [{"action": "Mix"}, " Bake ", {"unknown": 1}],
+        }
+    }
+
+    draft = _coerce_recipe_draft(raw, source_type="ocr")
+
+    assert [(i.name, i.quantity, i.unit) for i in draft.ingredients] == [
+        ("flour", "2", "cups"),
+        ("sugar", "1", "cup"),
+        ("eggs", "3", None),
+    ]
+    assert draft.steps == ["Mix", "Bake"]
+    assert draft.source.type == "ocr"
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ('```json\n{"a": 1}\n```', '{"a": 1}'),
+        ('Sure! {"a": 1} Hope that helps.', '{"a": 1}'),
+        ('[{"a": 1}]', '{"a": 1}'),
+        ("{not json}", None),
+        ("no braces here", None),
+    ],
+)
+def test_try_local_json_repair(raw, expected):
+    assert _try_local_json_repair(raw) == expected
@@ -74,6 +74,43 @@ def test_generate_happy_creates_stage_for_core(db_session):
     assert stage.user_id == "user-1"
 
 
+def test_generate_batches_stage_inserts_by_default(db_session):
+    request_id = str(uuid.uuid4())
+    day = DayInput(
+        date=date.today(),
+        meals={
+            "lunch": MealSlotInput(servings=2, tags=["easy"]),
+            "dinner": MealSlotInput(servings=2, tags=["easy"]),
+        },
+    )
+    req = MealPlanGenerateRequest(days=[day], preferences=Preferences())
+
+    def fake_details(recipe_id, **kwargs):
+        return {"id": recipe_id, "title": f"Core {recipe_id}", "ingredients": [], "steps": []}
+
+    mock_llm_fn = AsyncMock(return_value={
+        "selected_recipe_id": "core-1",
+        "confidence": 0.9,
+        "warnings": [],
+        "alternatives": [],
+    })
+    with patch("jarvis_recipes.app.services.llm_client.call_meal_plan_select", mock_llm_fn):
+        result, slot_failures = meal_plan_service.generate_meal_plan(
+            db_session,
+            "user-1",
+            req,
+            request_id,
+            search_fn=lambda db, **kwargs: [{"id": "core-1", "source": "core", "title": "Core", "tags": []}],
+            details_fn=lambda db, **kwargs: fake_details(**kwargs),
+        )
+
+    stage_ids = {slot.selection.recipe_id for slot in result.days[0].meals.values()}
+    assert slot_failures == 0
+    assert len(stage_ids) == 2
+    stored = db_session.query(models.StageRecipe).filter(models.StageRecipe.request_id == request_id).all()
+    assert {s.id for s in stored} == stage_ids
+
+
 def test_generate_partial_selection_null(db_session):
     request_id = str(uuid.uuid4())
 
@@ -114,6 +151,45 @@ def test_cleanup_stage_recipes(db_session):
     assert db_session.query(models.StageRecipe).count() == 0
 
 
+def test_cleanup_marks_matching_jobs_abandoned(db_session):
+    db_session.add(
+        models.StageRecipe(
+            id="stage-1",
+            user_id="user-1",
+            title="Old",
+            ingredients=[],
+            steps=[],
+            tags=[],
+            notes=[],
+            request_id="req-1",
+            created_at=datetime.utcnow() - timedelta(days=4),
+            expires_at=datetime.utcnow() - timedelta(days=1),
+        )
+    )
+    for job_id, request_id, status in [
+        ("job-1", "req-1", "RUNNING"),
+        ("job-2", "req-1", "COMPLETED"),
+        ("job-3", "req-2", "RUNNING"),
+    ]:
+        db_session.add(
+            models.RecipeParseJob(
+                id=job_id,
+                job_type="meal_plan_generate",
+                job_data={"request_id": request_id},
+                status=status,
+                user_id="user-1",
+            )
+        )
+    db_session.commit()
+
+    deleted, abandoned = meal_plan_service.cleanup_expired_stage_recipes(db_session, cutoff_hours=72, mark_jobs=True)
+
+    assert deleted == 1
+    assert abandoned == 1
+    statuses = {job.id: job.status for job in db_session.query(models.RecipeParseJob)}
+    assert statuses == {"job-1": "ABANDONED", "job-2": "COMPLETED", "job-3": "RUNNING"}
+
+
 def test_validation_requires_days():
     with pytest.raises(Exception):
         MealPlanGenerateRequest(days=[], preferences=Preferences())
@@ -368,6 +444,64 @@ def test_deterministic_mode_no_llm(db_session):
     assert slot_failures == 0
 
 
+def test_deterministic_mode_distinct_picks_within_day(db_session):
+    day = DayInput(
+        date=date.today(),
+        meals={"lunch": MealSlotInput(servings=2), "dinner": MealSlotInput(servings=2)},
+    )
+    req = MealPlanGenerateRequest(days=[day], preferences=Preferences())
+    candidates = [
+        {"id": "user-1", "source": "user", "title": "First", "tags": []},
+        {"id": "user-2", "source": "user", "title": "Second", "tags": []},
+    ]
+
+    result, slot_failures = meal_plan_service.generate_meal_plan(
+        db_session,
+        "user-1",
+        req,
+        str(uuid.uuid4()),
+        search_fn=lambda db, **kwargs: candidates,
+        details_fn=lambda db, **kwargs: None,
+        use_llm=False,
+    )
+
+    meals = result.days[0].meals
+    assert slot_failures == 0
+    assert (meals["lunch"].selection.recipe_id, meals["dinner"].selection.recipe_id) == ("user-1", "user-2")
+
+
+def test_llm_pick_taken_earlier_in_day_falls_back_to_unused_candidate(db_session):
+    day = DayInput(
+        date=date.today(),
+        meals={"lunch": MealSlotInput(servings=2), "dinner": MealSlotInput(servings=2)},
+    )
+    req = MealPlanGenerateRequest(days=[day], preferences=Preferences())
+    candidates = [
+        {"id": "user-1", "source": "user", "title": "First", "tags": []},
+        {"id": "user-2", "source": "user", "title": "Second", "tags": []},
+    ]
+    mock_llm_fn = AsyncMock(return_value={
+        "selected_recipe_id": "user-1",
+        "confidence": 0.9,
+        "warnings": [],
+        "alternatives": [],
+    })
+
+    with patch("jarvis_recipes.app.services.llm_client.call_meal_plan_select", mock_llm_fn):
+        result, slot_failures = meal_plan_service.generate_meal_plan(
+            db_session,
+            "user-1",
+            req,
+            str(uuid.uuid4()),
+            search_fn=lambda db, **kwargs: candidates,
+            details_fn=lambda db, **kwargs: None,
+        )
+
+    meals = result.days[0].meals
+    assert slot_failures == 0
+    assert (meals["lunch"].selection.recipe_id, meals["dinner"].selection.recipe_id) == ("user-1", "user-2")
+
+
 def test_llm_failure_fallback_to_deterministic(db_session):
     """Test that when LLM fails to connect, system falls back to deterministic selection."""
     request_id = str(uuid.uuid4())
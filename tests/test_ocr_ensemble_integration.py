@@ -325,7 +325,6 @@ class TestOCREnsembleIntegration:
             db=integration_db,
             job=job,
             payload=payload,
-            parent_job_id=ocr_message["trace"]["parent_job_id"]
         )
 
         # 5. Verify results
@@ -452,7 +451,6 @@ class TestOCREnsembleIntegration:
             db=integration_db,
             job=job,
             payload=payload,
-            parent_job_id=ocr_message["trace"]["parent_job_id"]
         )
 
         integration_db.refresh(job)
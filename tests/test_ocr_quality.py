@@ -0,0 +1,40 @@
+from jarvis_recipes.app.services.ocr_quality import _gibberish_flags, score_quality
+
+
+def test_gibberish_flags_counts_letters_and_vowels():
+    flags = _gibberish_flags("Bake 2 pz at xy")
+
+    assert flags["alpha_ratio"] == 10 / 15
+    assert flags["token_count"] == 4
+    assert flags["vowel_ratio"] == 3 / 10
+    assert flags["vowelful_tokens"] == 2
+    assert flags["is_gibberish"] is True
+
+
+def test_score_quality_passes_recipe_text():
+    lines = ["Ingredients", "2 cups flour", "1 tsp salt", "Directions"]
+    lines += [f"{i}. Mix the flour and salt together in a large bowl until combined" for i in range(1, 10)]
+    text = "\n".join(lines)
+
+    result = score_quality(text, mean_confidence=80)
+
+    assert result["gibberish"] is False
+    assert result["score"] == 4
+    assert result["pass_gate"] is True
+
+
+def test_score_quality_rejects_noise():
+    result = score_quality("xq zr 7 /. ~~ xq zr\n" * 40, mean_confidence=None)
+
+    assert result["gibberish"] is True
+    assert result["hard_fail"] is True
+    assert result["pass_gate"] is False
+
+
+def test_score_quality_short_text_fails_without_scoring():
+    result = score_quality("Ingredients\n2 cups flour", mean_confidence=90)
+
+    assert result["hard_fail"] is True
+    assert result["pass_gate"] is False
+    assert result["score"] == 0
+    assert result["token_count"] is None
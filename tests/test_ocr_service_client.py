@@ -0,0 +1,43 @@
+import httpx
+import pytest
+
+from jarvis_recipes.app.services import ocr_service_client
+
+
+@pytest.fixture
+def ocr_transport(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "results": [{"text": "2 cups flour", "blocks": [{"confidence": 0.5}, {"confidence": 0.7}], "meta": {"i": 0}}],
+                "meta": {"provider_used": "tesseract"},
+            },
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(ocr_service_client, "_get_client", lambda: client)
+    monkeypatch.setattr(ocr_service_client.service_config, "get_ocr_url", lambda: "http://ocr")
+    monkeypatch.setattr(ocr_service_client, "_get_auth_headers", lambda: {})
+    monkeypatch.setattr(ocr_service_client, "_ocr_result_cache", ocr_service_client.OrderedDict())
+    return calls
+
+
+async def test_batch_results_are_cached_by_image_content(ocr_transport):
+    first = await ocr_service_client.call_ocr_service_batch([b"img-1"])
+    second = await ocr_service_client.call_ocr_service_batch([b"img-1"])
+
+    assert first == ("2 cups flour", pytest.approx(60.0), "tesseract", [{"i": 0}])
+    assert second == first
+    assert len(ocr_transport) == 1
+
+
+async def test_batch_cache_key_includes_images_and_provider(ocr_transport):
+    await ocr_service_client.call_ocr_service_batch([b"img-1"])
+    await ocr_service_client.call_ocr_service_batch([b"img-2"])
+    await ocr_service_client.call_ocr_service_batch([b"img-1"], provider="easyocr")
+
+    assert len(ocr_transport) == 3
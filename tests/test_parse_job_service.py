@@ -0,0 +1,190 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
+
+from jarvis_recipes.app.db import models
+from jarvis_recipes.app.db.base import Base
+from jarvis_recipes.app.services import parse_job_service
+from jarvis_recipes.app.services.image_ingest_worker import _ImageParseResult
+from jarvis_recipes.app.services.url_recipe_parser import ParsedIngredient, ParsedRecipe, ParseResult
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def _job(db_session, status="PENDING", job_type="url"):
+    job = models.RecipeParseJob(id="job-1", user_id="user-1", job_type=job_type, status=status, attempts=0)
+    db_session.add(job)
+    db_session.commit()
+    return job
+
+
+def test_mark_running_increments_attempts(db_session):
+    job = _job(db_session)
+
+    parse_job_service.mark_running(db_session, job)
+    parse_job_service.mark_running(db_session, job)
+
+    assert job.status == "RUNNING"
+    assert job.attempts == 2
+    assert job.started_at is not None
+
+
+def test_mark_complete_stores_recipe_draft(db_session):
+    job = _job(db_session, status="RUNNING")
+    result = ParseResult(
+        success=True,
+        recipe=ParsedRecipe(
+            title="Pancakes",
+            source_url="https://example.com/pancakes",
+            ingredients=[ParsedIngredient(text="flour", quantity_display="2 cups")],
+            steps=["Mix"],
+        ),
+        parser_strategy="schema_org",
+    )
+
+    parse_job_service.mark_complete(db_session, job, result)
+
+    assert job.status == "COMPLETE"
+    draft = job.result_json["recipe_draft"]
+    assert draft["title"] == "Pancakes"
+    assert draft["ingredients"][0]["quantity"] == "2"
+    assert draft["ingredients"][0]["unit"] == "cups"
+    assert job.result_json["pipeline"]["parser_strategy"] == "schema_org"
+
+
+def test_mark_complete_accepts_image_result_shim(db_session):
+    job = _job(db_session, status="RUNNING", job_type="image")
+    result = _ImageParseResult(
+        {
+            "recipe_draft": {"title": "Toast", "ingredients": [{"text": "bread"}], "steps": ["Toast it"]},
+            "pipeline": {"parser_strategy": "ocr", "warnings": ["low_confidence"]},
+        }
+    )
+
+    parse_job_service.mark_complete(db_session, job, result)
+
+    assert job.status == "COMPLETE"
+    assert job.result_json["recipe_draft"]["title"] == "Toast"
+    assert job.result_json["pipeline"]["warnings"] == ["low_confidence"]
+
+
+def test_mark_error_does_not_overwrite_concurrent_cancel(db_session):
+    job = _job(db_session, status="RUNNING")
+    # Another request cancels the job without this session's copy noticing
+    db_session.execute(
+        update(models.RecipeParseJob)
+        .where(models.RecipeParseJob.id == job.id)
+        .values(status="CANCELED")
+        .execution_options(synchronize_session=False)
+    )
+    db_session.commit()
+    set_committed_value(job, "status", "RUNNING")
+
+    parse_job_service.mark_error(db_session, job, "llm_failed", "boom")
+
+    assert job.status == "CANCELED"
+    assert job.error_code is None
+
+
+def test_mark_canceled_only_from_active_states(db_session):
+    job = _job(db_session, status="COMPLETE")
+
+    assert parse_job_service.mark_canceled(db_session, job) is True
+    assert job.status == "CANCELED"
+    assert job.canceled_at is not None
+    assert parse_job_service.mark_canceled(db_session, job) is False
+
+
+def test_claim_next_pending_marks_oldest_job_running(db_session):
+    now = datetime.utcnow()
+    for job_id, job_type, age in [("old", "url", 10), ("new", "url", 1), ("img", "image", 20)]:
+        db_session.add(
+            models.RecipeParseJob(
+                id=job_id,
+                user_id="user-1",
+                job_type=job_type,
+                status="PENDING",
+                attempts=0,
+                created_at=now - timedelta(minutes=age),
+            )
+        )
+    db_session.commit()
+
+    first = parse_job_service.claim_next_pending(db_session, job_type="url")
+    second = parse_job_service.claim_next_pending(db_session, job_type="url")
+    third = parse_job_service.claim_next_pending(db_session, job_type="url")
+
+    assert (first.id, first.status, first.attempts) == ("old", "RUNNING", 1)
+    assert second.id == "new"
+    assert third is None
+    assert db_session.get(models.RecipeParseJob, "img").status == "PENDING"
+
+
+def test_recipe_dict_to_draft_splits_quantities():
+    draft = parse_job_service._recipe_dict_to_draft(
+        {
+            "title": "Pie",
+            "ingredients": [
+                {"text": "flour", "quantity_display": "2 cups"},
+                {"name": "salt", "quantity": "1", "unit": "tsp"},
+                {"label": "water"},
+            ],
+            "prep_time_minutes": 10,
+            "cook_time_minutes": 20,
+        },
+        "ocr",
+    )
+
+    assert [(i["name"], i["quantity"], i["unit"]) for i in draft["ingredients"]] == [
+        ("flour", "2", "cups"),
+        ("salt", "1", "tsp"),
+        ("water", None, None),
+    ]
+    assert draft["total_time_minutes"] == 30
+    assert draft["source"]["type"] == "ocr"
+
+
+def test_is_job_canceled_reads_current_status(db_session):
+    job = _job(db_session)
+    db_session.execute(
+        update(models.RecipeParseJob).where(models.RecipeParseJob.id == job.id).values(status="CANCELED")
+    )
+    set_committed_value(job, "status", "PENDING")
+
+    assert parse_job_service.is_job_canceled(db_session, job.id)
+    assert not parse_job_service.is_job_canceled(db_session, "missing")
+
+
+def test_load_job_with_ingestion_joins_on_job_data(db_session):
+    db_session.add(models.RecipeIngestion(id="ing-1", user_id="user-1", image_s3_keys=[]))
+    job = _job(db_session, job_type="image")
+    job.job_data = {"ingestion_id": "ing-1"}
+    db_session.commit()
+    db_session.expunge_all()
+
+    loaded_job, ingestion = parse_job_service.load_job_with_ingestion(db_session, "job-1")
+
+    assert loaded_job.id == "job-1"
+    assert ingestion.id == "ing-1"
+    assert parse_job_service.load_job_with_ingestion(db_session, "missing") == (None, None)
+
+
+def test_transition_reloads_job_without_expire_on_commit(db_session):
+    db_session.expire_on_commit = False
+    job = _job(db_session)
+
+    parse_job_service.mark_running(db_session, job)
+
+    assert job.status == "RUNNING"
+    assert job.attempts == 1
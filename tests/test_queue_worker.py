@@ -0,0 +1,217 @@
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from jarvis_recipes.app.db import models
+from jarvis_recipes.app.db.base import Base
+from jarvis_recipes.app.schemas.ingestion import RecipeDraft, RecipeDraftIngredient, RecipeDraftSource
+from jarvis_recipes.app.services import queue_worker
+
+
+def _draft(description="A pie", names=("flour", "sugar", "butter")):
+    return RecipeDraft(
+        title="Simple Pie",
+        description=description,
+        ingredients=[RecipeDraftIngredient(name=n, quantity="1", unit="cup") for n in names],
+        steps=["Mix", "Bake"],
+        source=RecipeDraftSource(type="ocr"),
+    )
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    async def fake_structure(text, model_name):
+        calls.append("structure")
+        return _draft(description=None) if "dirty" in text else _draft()
+
+    async def fake_clean(draft, model_name):
+        calls.append("clean")
+        return draft.model_copy(update={"description": "Cleaned"})
+
+    monkeypatch.setattr(queue_worker, "call_text_structuring", fake_structure)
+    monkeypatch.setattr(queue_worker, "clean_and_validate_draft", fake_clean)
+    return calls
+
+
+def test_structure_skips_cleanup_for_clean_draft(llm_calls):
+    draft, cleanup_ran, aborted = queue_worker._run(
+        queue_worker._structure_then_maybe_clean("job-1", "clean text", "m", lambda: False)
+    )
+
+    assert not cleanup_ran
+    assert not aborted
+    assert draft.description == "A pie"
+    assert llm_calls == ["structure"]
+
+
+def test_structure_cleans_dirty_draft_in_one_run(llm_calls):
+    draft, cleanup_ran, aborted = queue_worker._run(
+        queue_worker._structure_then_maybe_clean("job-1", "dirty text", "m", lambda: False)
+    )
+
+    assert cleanup_ran
+    assert not aborted
+    assert draft.description == "Cleaned"
+    assert llm_calls == ["structure", "clean"]
+
+
+def test_structure_aborts_before_cleanup_when_canceled(llm_calls):
+    _, _, aborted = queue_worker._run(
+        queue_worker._structure_then_maybe_clean("job-1", "dirty text", "m", lambda: True)
+    )
+
+    assert aborted
+    assert llm_calls == ["structure"]
+
+
+@pytest.mark.parametrize(
+    "names,unit,expected",
+    [
+        (("eggs", "ginger", "sugar"), None, False),
+        (("2 cups flour", "ginger", "sugar"), None, True),
+        (("2 cups flour", "ginger", "sugar"), "cup", False),
+        (("salt and pepper", "ginger", "sugar"), "pinch", True),
+        (("onion, diced", "ginger", "sugar"), "whole", True),
+    ],
+)
+def test_needs_cleaning_heuristics(names, unit, expected):
+    draft = _draft(names=names).model_copy(
+        update={"ingredients": [RecipeDraftIngredient(name=n, unit=unit) for n in names]}
+    )
+
+    assert queue_worker._needs_cleaning(draft, "job-1") is expected
+
+
+def test_process_job_drops_malformed_payload(caplog):
+    queue_worker.process_job("{not json")
+
+    assert "Failed to parse job payload JSON" in caplog.text
+
+
+def test_ocr_completed_combines_successful_pages_in_order(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(models.RecipeIngestion(id="ing-1", user_id="user-1", image_s3_keys=[]))
+    job = models.RecipeParseJob(
+        id="job-1", user_id="user-1", job_type="image", status="RUNNING", job_data={"ingestion_id": "ing-1"}
+    )
+    db.add(job)
+    db.commit()
+
+    seen = {}
+
+    def fake_score(text, mean_confidence):
+        seen.update(text=text, mean_confidence=mean_confidence)
+        return {"hard_fail": True, "pass_gate": False, "char_count": len(text), "gibberish": False}
+
+    monkeypatch.setattr(queue_worker.ocr_quality, "score_quality", fake_score)
+    payload = {
+        "status": "success",
+        "results": [
+            {"index": 2, "ocr_text": "page three", "meta": {"confidence": 0.5, "tier": "t2"}},
+            {"index": 1, "error": {"code": "decode_failed", "message": "bad image"}},
+            {"index": 0, "ocr_text": "page one", "meta": {"confidence": 0.9, "tier": "t1"}},
+        ],
+    }
+
+    queue_worker._process_ocr_completed(db, job, payload)
+
+    assert seen == {"text": "page one\n\npage three", "mean_confidence": pytest.approx(0.7)}
+    db.expire_all()
+    assert db.get(models.RecipeParseJob, "job-1").error_code == "quality_gate_failed"
+    assert db.get(models.RecipeIngestion, "ing-1").status == "FAILED"
+
+
+@pytest.mark.parametrize(
+    "job_type,error_code",
+    [
+        ("ocr.completed", "ocr_failed"),
+        ("recipe.create.manual.requested", "not_implemented"),
+        ("something.else", "unknown_job_type"),
+    ],
+)
+def test_process_job_dispatches_envelope_by_job_type(monkeypatch, job_type, error_code):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(queue_worker, "SessionLocal", sessionmaker(bind=engine))
+    with queue_worker.SessionLocal() as db:
+        db.add(models.RecipeParseJob(id="job-1", user_id="user-1", job_type="url", status="PENDING"))
+        db.commit()
+
+    queue_worker.process_job(
+        '{"schema_version": 1, "job_id": "job-1", "job_type": "%s", "payload": {}}' % job_type
+    )
+
+    with queue_worker.SessionLocal() as db:
+        job = db.get(models.RecipeParseJob, "job-1")
+        assert (job.status, job.error_code, job.attempts) == ("ERROR", error_code, 1)
+
+
+def test_process_job_accepts_nan_from_python_producers(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(queue_worker, "SessionLocal", sessionmaker(bind=engine))
+    with queue_worker.SessionLocal() as db:
+        db.add(models.RecipeParseJob(id="job-1", user_id="user-1", job_type="url", status="PENDING"))
+        db.commit()
+
+    queue_worker.process_job(
+        '{"schema_version": 1, "job_id": "job-1", "job_type": "recipe.create.manual.requested",'
+        ' "payload": {"confidence": NaN}}'
+    )
+
+    with queue_worker.SessionLocal() as db:
+        job = db.get(models.RecipeParseJob, "job-1")
+        assert (job.status, job.error_code) == ("ERROR", "not_implemented")
+
+
+def test_ocr_completed_reports_every_failed_image():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    job = models.RecipeParseJob(id="job-1", user_id="user-1", job_type="image", status="RUNNING")
+    db.add(job)
+    db.commit()
+    payload = {
+        "status": "success",
+        "results": [
+            {"index": 1, "error": {"code": "timeout"}},
+            {"index": 0, "error": {"code": "decode_failed", "message": "bad image"}},
+        ],
+    }
+
+    queue_worker._process_ocr_completed(db, job, payload)
+
+    db.expire_all()
+    job = db.get(models.RecipeParseJob, "job-1")
+    assert job.error_code == "decode_failed"
+    assert job.error_message == "All images failed OCR: Image 0: bad image; Image 1: Unknown error"
+
+
+def test_ocr_completed_marks_ingestion_running_before_quality_gate(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine, expire_on_commit=False)()
+    ingestion = models.RecipeIngestion(id="ing-1", user_id="user-1", image_s3_keys=[])
+    job = models.RecipeParseJob(
+        id="job-1", user_id="user-1", job_type="image", status="RUNNING", job_data={"ingestion_id": "ing-1"}
+    )
+    db.add_all([ingestion, job])
+    db.commit()
+    seen = {}
+
+    def fake_score(text, mean_confidence):
+        seen["status"] = ingestion.status
+        seen["stored"] = db.scalar(select(models.RecipeIngestion.status))
+        return {"hard_fail": True, "pass_gate": False, "char_count": len(text), "gibberish": False}
+
+    monkeypatch.setattr(queue_worker.ocr_quality, "score_quality", fake_score)
+    payload = {"status": "success", "results": [{"index": 0, "ocr_text": "page one"}]}
+
+    queue_worker._process_ocr_completed(db, job, payload, ingestion=ingestion)
+
+    assert seen == {"status": "RUNNING", "stored": "RUNNING"}
+    assert ingestion.status == "FAILED"
@@ -59,6 +59,34 @@ def test_extract_recipe_heuristic():
     assert parsed.steps[0].startswith("Heat")
 
 
+def test_soup_extractors_share_one_parse():
+    from bs4 import BeautifulSoup
+
+    html = """
+    <html>
+      <head>
+        <script type="application/ld+json">
+        {"@type": "Recipe", "name": "Shared Soup", "recipeIngredient": ["1 cup broth"],
+         "recipeInstructions": ["Heat"]}
+        </script>
+      </head>
+      <body>
+        <h1>Shared Soup</h1>
+        <article>
+          <ul><li>1 cup broth</li><li>2 tsp salt</li></ul>
+          <h2>Directions</h2>
+          <ol><li>Heat the broth.</li><li>Add salt.</li></ol>
+        </article>
+      </body>
+    </html>
+    """
+    soup = BeautifulSoup(html, "lxml")
+    from_schema = url_recipe_parser.extract_recipe_from_schema_org_soup(soup, "https://example.com/s")
+    from_heuristic = url_recipe_parser.extract_recipe_heuristic_soup(soup, "https://example.com/s")
+    assert from_schema is not None and from_schema.title == "Shared Soup"
+    assert from_heuristic is not None and from_heuristic.steps[0].startswith("Heat")
+
+
 @pytest.mark.asyncio
 async def test_extract_recipe_via_llm(monkeypatch):
     settings = url_recipe_parser.get_settings()